@@ -12,21 +12,26 @@ async def get_accounts(client) -> list[dict]:
     return data.get("accounts", [])
 
 
+CSV_FIELDS = ("id", "name", "type", "balance", "institution", "mask")
+
+
 def format_csv(accounts: list[dict]) -> str:
     """Format accounts as CSV."""
     output = io.StringIO()
-    fieldnames = ["id", "name", "type", "balance", "institution", "mask"]
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    for a in accounts:
-        writer.writerow({
-            "id": a.get("id", ""),
-            "name": a.get("displayName", ""),
-            "type": (a.get("type") or {}).get("display", ""),
-            "balance": a.get("currentBalance", 0),
-            "institution": (a.get("institution") or {}).get("name", ""),
-            "mask": a.get("mask", ""),
-        })
+    writer = csv.writer(output)
+    writer.writerow(CSV_FIELDS)
+    # Tuples in CSV_FIELDS order, skipping DictWriter's per-row dict
+    writer.writerows(
+        (
+            a.get("id", ""),
+            a.get("displayName", ""),
+            (a.get("type") or {}).get("display", ""),
+            a.get("currentBalance", 0),
+            (a.get("institution") or {}).get("name", ""),
+            a.get("mask", ""),
+        )
+        for a in accounts
+    )
     return output.getvalue()
 
 
@@ -39,14 +44,21 @@ def format_text(accounts: list[dict]) -> str:
         if amount is None:
             return "$0.00"
         if amount < 0:
-            return f"-${abs(amount):,.2f}"
-        return f"${amount:,.2f}"
-
-    # Group by type
-    by_type: dict[str, list[dict]] = {}
-    for acc in accounts:
+            return "-$" + format(-amount, ",.2f")
+        return "$" + format(amount, ",.2f")
+
+    # Group by type, accumulating per-type and overall totals in the same pass.
+    # Rows are stored pre-decorated as (sort key, position, account, balance) so
+    # each group sorts on plain tuples; position keeps ties stable.
+    by_type: dict[str, list[tuple[float, int, dict, float]]] = {}
+    type_totals: dict[str, float] = {}
+    total = 0
+    for i, acc in enumerate(accounts):
         acc_type = acc.get("type", {}).get("display", "Other")
-        by_type.setdefault(acc_type, []).append(acc)
+        balance = acc.get("currentBalance", 0) or 0
+        by_type.setdefault(acc_type, []).append((-abs(balance), i, acc, balance))
+        type_totals[acc_type] = type_totals.get(acc_type, 0) + balance
+        total += balance
 
     lines = []
     lines.append(f"ACCOUNTS ({len(accounts)})")
@@ -54,39 +66,33 @@ def format_text(accounts: list[dict]) -> str:
     col_widths = [30, 18, 14]
     alignments = ["l", "l", "r"]
 
-    def make_table(rows: list[tuple]) -> list[str]:
-        result = []
+    # Per-column cell templates, built once; %.Ns both pads and truncates
+    cell_fmts = [
+        f" %{w}.{w}s " if align == "r" else f" %-{w}.{w}s "
+        for w, align in zip(col_widths, alignments)
+    ]
+
+    def make_table(rows: list[tuple]) -> None:
+        """Append table lines straight onto the output lines."""
         separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
-        result.append(separator)
+        lines.append(separator)
         for i, row in enumerate(rows):
-            cells = []
-            for val, width, align in zip(row, col_widths, alignments):
-                text = str(val)[:width]
-                if align == "r":
-                    cells.append(f" {text:>{width}} ")
-                else:
-                    cells.append(f" {text:<{width}} ")
-            result.append("|" + "|".join(cells) + "|")
+            lines.append("|" + "|".join([fmt % (val,) for fmt, val in zip(cell_fmts, row)]) + "|")
             if i == 0:
-                result.append(separator)
-        result.append(separator)
-        return result
+                lines.append(separator)
+        lines.append(separator)
 
     rows = [("Account", "Institution", "Balance")]
 
     for acc_type in sorted(by_type.keys()):
-        accts = by_type[acc_type]
-        type_total = sum(a.get("currentBalance", 0) or 0 for a in accts)
-        rows.append((f"[{acc_type}]", "", fmt_money(type_total)))
-        for acc in sorted(accts, key=lambda x: -abs(x.get("currentBalance", 0) or 0)):
+        rows.append((f"[{acc_type}]", "", fmt_money(type_totals[acc_type])))
+        for _, _, acc, balance in sorted(by_type[acc_type]):
             name = acc.get("displayName", "Unknown")
             inst = (acc.get("institution") or {}).get("name", "")
-            balance = acc.get("currentBalance", 0) or 0
             rows.append((f"  {name}", inst[:18], fmt_money(balance)))
 
-    lines.extend(make_table(rows))
+    make_table(rows)
 
-    total = sum(a.get("currentBalance", 0) or 0 for a in accounts)
     lines.append("")
     lines.append(f"Total: {fmt_money(total)}")
 
@@ -0,0 +1,62 @@
+"""On-disk cache for slow-changing lookups (accounts, categories).
+
+Entries are JSON files under get_cache_dir(), one per lookup and scope. The
+scope is derived from the API token, so switching tokens never serves another
+login's data. Freshness is judged by file modification time, and every
+failure is treated as a miss: the cache only ever saves a round trip.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import get_cache_dir
+
+# Lookups kept in the cache; clear() removes only their entries
+NAMES = ("accounts", "categories")
+
+
+def scope_for_token(token: str) -> str:
+    """Derive a cache scope from a token without exposing the token itself."""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def _entry_path(name: str, scope: str) -> Path:
+    return get_cache_dir() / f"{name}-{scope}.json"
+
+
+def load(name: str, scope: str, ttl: float) -> Optional[Any]:
+    """Return the cached value, or None if missing, stale, or unreadable."""
+    path = _entry_path(name, scope)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def store(name: str, scope: str, value: Any) -> None:
+    """Write value to the cache atomically; errors are ignored."""
+    path = _entry_path(name, scope)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(value, default=str))
+        tmp.replace(path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def clear() -> int:
+    """Delete the cached lookup entries. Returns the number of files removed."""
+    removed = 0
+    for name in NAMES:
+        for path in get_cache_dir().glob(f"{name}-*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
@@ -2,22 +2,37 @@
 """Monarch Money CLI."""
 
 import fnmatch
+import functools
+import io
+import itertools
 import json
+import re
 import sys
-from typing import Optional
+from typing import Callable, Optional, Union
 
 import click
 
-from . import accounts, net_worth, recurring, transactions
+from . import accounts, cache, jsonutil, net_worth, recurring, transactions
 from .client import AuthenticationError, APIError
 from .providers import get_provider
 
 
+# Rows fetched per request, and most rows scanned in all, when a listing is
+# filtered client-side (--merchant, --notes, --original-statement)
+FILTER_PAGE_SIZE = 100
+MAX_FILTER_SCAN = 2000
+
+# Seconds cached account/category lists are trusted for name resolution
+LOOKUP_CACHE_TTL = 10 * 60
+
+
 @click.group()
 @click.version_option(version="0.1.0")
-def cli():
+@click.option("--no-cache", is_flag=True, help="Fetch account/category lists fresh instead of from the local cache")
+@click.pass_context
+def cli(ctx, no_cache: bool):
     """Monarch Money CLI - Access your financial data."""
-    pass
+    ctx.ensure_object(dict)["no_cache"] = no_cache
 
 
 @cli.group("transactions")
@@ -35,8 +50,10 @@ def transactions_group():
 @click.option("--merchant", help="Filter by merchant name (supports * wildcards)")
 @click.option("--notes", help="Filter by notes content (supports * wildcards)")
 @click.option("--original-statement", "original_statement", help="Filter by original statement (supports * wildcards)")
-@click.option("--limit", default=1000, help="Max transactions to fetch")
+@click.option("--limit", default=1000, help=f"Max transactions to show; with --merchant/--notes/--original-statement, up to {MAX_FILTER_SCAN} transactions are scanned for matches")
+@click.pass_obj
 def list_transactions(
+    obj: dict,
     output_format: str,
     account: tuple,
     category: tuple,
@@ -51,7 +68,7 @@ def list_transactions(
     try:
         result = _list_transactions(
             output_format, account, category, start_date, end_date,
-            merchant, notes, original_statement, limit
+            merchant, notes, original_statement, limit, obj["no_cache"]
         )
         click.echo(result)
     except AuthenticationError as e:
@@ -72,7 +89,8 @@ def _list_transactions(
     notes: Optional[str],
     original_statement: Optional[str],
     limit: int,
-) -> str:
+    no_cache: bool,
+) -> Union[str, bytes]:
     """Implementation of list transactions."""
     provider = get_provider()
 
@@ -80,81 +98,277 @@ def _list_transactions(
     account_names = _parse_multi_option(account)
     category_names = _parse_multi_option(category)
 
-    # Get account IDs if filtering by account name
-    account_ids = None
-    if account_names:
-        accts = provider.get_accounts()
-        account_ids = [
-            a["id"] for a in accts
-            if any(fnmatch.fnmatch(a["displayName"].lower(), name.lower()) for name in account_names)
-        ]
-        if not account_ids:
-            return json.dumps({"error": f"No accounts matching: {account_names}"})
-
-    # Get category IDs if filtering by category name
-    category_ids = None
-    if category_names:
-        cats = provider.get_categories()
-        category_ids = [
-            c["id"] for c in cats
-            if any(fnmatch.fnmatch(c["name"].lower(), name.lower()) for name in category_names)
-        ]
-        if not category_ids:
-            return json.dumps({"error": f"No categories matching: {category_names}"})
-
-    # Fetch transactions
-    data = provider.get_transactions(
-        limit=limit,
+    def resolve(accts, cats):
+        return (
+            _resolve_ids(accts, "displayName", account_names) if account_names else None,
+            _resolve_ids(cats, "name", category_names) if category_names else None,
+        )
+
+    # Fetch only the lookups the filters need, then resolve and validate both
+    # filters before the transactions request
+    want = (provider, bool(account_names), bool(category_names), no_cache)
+    accts, cats, cached = _name_lookups(*want)
+    account_ids, category_ids = resolve(accts, cats)
+    if cached and [] in (account_ids, category_ids):
+        # The name may be newer than the cached lists; retry once on fresh ones
+        accts, cats, _ = _name_lookups(*want, refresh=True)
+        account_ids, category_ids = resolve(accts, cats)
+
+    if account_ids == []:
+        return json.dumps({"error": f"No accounts matching: {account_names}"})
+    if category_ids == []:
+        return json.dumps({"error": f"No categories matching: {category_names}"})
+
+    # Client-side filters (merchant, notes, original_statement), fused into
+    # one predicate applied in a single pass
+    predicates = []
+    if merchant:
+        match_merchant = _matcher(merchant)
+        predicates.append(lambda t: match_merchant(_merchant_name(t)))
+    if notes:
+        match_notes = _matcher(notes)
+        predicates.append(lambda t: match_notes(t.get("notes") or ""))
+    if original_statement:
+        match_statement = _matcher(original_statement)
+        predicates.append(lambda t: match_statement(t.get("plaidName") or ""))
+    predicate = None
+    if len(predicates) == 1:
+        # Common case: call the one predicate directly, no per-row generator
+        predicate = predicates[0]
+    elif predicates:
+        def predicate(t: dict) -> bool:
+            return all(p(t) for p in predicates)
+
+    # Fetch transactions, narrowing server-side by a literal fragment of the
+    # text filters; the exact wildcard match still runs on the results below
+    fetch = functools.partial(
+        provider.get_transactions,
         start_date=start_date,
         end_date=end_date,
         account_ids=account_ids,
         category_ids=category_ids,
+        search=_search_hint(merchant, notes),
     )
 
-    txns = data.get("results", [])
-    total_count = data.get("totalCount", 0)
-
-    # Apply client-side filters (merchant, notes, original_statement)
-    if merchant:
-        txns = [t for t in txns if _wildcard_match((t.get("merchant") or {}).get("name", ""), merchant)]
-    if notes:
-        txns = [t for t in txns if _wildcard_match(t.get("notes") or "", notes)]
-    if original_statement:
-        txns = [t for t in txns if _wildcard_match(t.get("plaidName") or "", original_statement)]
-
-    # Check if there are more results than returned
-    truncated = total_count > limit
+    scanned = None
+    if predicate is None:
+        data = fetch(limit=limit)
+        txns = data.get("results", [])
+        total_count = data.get("totalCount", 0)
+        truncated = total_count > limit
+    else:
+        # Scan fixed-size pages until `limit` rows match, the candidates run
+        # out, or MAX_FILTER_SCAN rows have been scanned
+        txns, scanned, total_count = [], 0, 0
+        unscanned = True
+        while len(txns) < limit and unscanned and scanned < MAX_FILTER_SCAN:
+            data = fetch(limit=FILTER_PAGE_SIZE, offset=scanned)
+            page = data.get("results", [])
+            total_count = data.get("totalCount", 0)
+            if not page:
+                unscanned = False
+                break
+            scanned += len(page)
+            txns.extend(filter(predicate, page))
+            unscanned = scanned < total_count
+        # Matches beyond `limit` are dropped, so they count as truncation too
+        truncated = unscanned or len(txns) > limit
+        del txns[limit:]
+
+    if scanned is None:
+        note = f"Showing {len(txns)} of {total_count} transactions. Use --limit to fetch more."
+    else:
+        note = (
+            f"Showing {len(txns)} matching transactions ({scanned} of {total_count} scanned). "
+            "Raise --limit or narrow the date range to see more."
+        )
 
     # Format output
     if output_format == "json":
         result = {"transactions": txns, "count": len(txns), "total": total_count}
+        if scanned is not None:
+            result["scanned"] = scanned
         if truncated:
             result["truncated"] = True
-            result["message"] = f"Showing {limit} of {total_count} transactions. Use --limit to fetch more."
-        return json.dumps(result, indent=2, default=str)
+            result["message"] = note
+        return jsonutil.dumpb(result, indent=_pretty_json())
     elif output_format == "csv":
-        output = transactions.format_csv(txns)
+        # Append the note to the same buffer rather than copying the whole CSV
+        output = io.StringIO()
+        transactions.write_csv(txns, output)
         if truncated:
-            output += f"\n# Showing {limit} of {total_count} transactions. Use --limit to fetch more.\n"
-        return output
+            output.write(f"\n# {note}\n")
+        return output.getvalue()
     else:
         output = transactions.format_text(txns)
         if truncated:
-            output += f"\n\n(Showing {limit} of {total_count} transactions. Use --limit to fetch more.)"
+            output += f"\n\n({note})"
         return output
 
 
+def _pretty_json() -> bool:
+    """Indent JSON for a terminal; emit compact JSON when piped."""
+    return sys.stdout.isatty()
+
+
+def _merchant_name(t: dict) -> str:
+    """Merchant name of a transaction, or "" when it has no merchant."""
+    merchant = t.get("merchant")
+    return merchant.get("name", "") if merchant else ""
+
+
 def _parse_multi_option(values: tuple) -> list[str]:
     """Parse comma-separated values from multiple option flags."""
-    result = []
-    for val in values:
-        result.extend([v.strip() for v in val.split(",") if v.strip()])
-    return result
+    return [s for s in _MULTI_SPLIT_RE.split(",".join(values).strip()) if s]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_wildcard(pattern: str) -> re.Pattern:
+    """Compile a case-insensitive * wildcard pattern to a regex once."""
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_wildcard_union(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile several wildcard patterns into one alternation regex."""
+    if len(patterns) == 1:
+        return _compile_wildcard(patterns[0])
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), re.IGNORECASE
+    )
+
+
+def _matcher(pattern: str) -> Callable[[str], object]:
+    """Return a case-insensitive full-match test for pattern.
+
+    Literal patterns compare with == instead of going through a regex.
+    """
+    if _is_wildcard(pattern):
+        return _compile_wildcard(pattern).match
+    lowered = pattern.lower()
+    return lambda text: text.lower() == lowered
+
+
+def _name_lookups(
+    provider, want_accounts: bool, want_categories: bool, no_cache: bool, refresh: bool = False
+) -> tuple[Optional[list[dict]], Optional[list[dict]], bool]:
+    """Fetch the account and/or category lists used to resolve names.
+
+    Lists come from the on-disk cache when fresh (API provider only, unless
+    no_cache); whatever is missing is fetched, both at once when both are.
+    With refresh, cached lists are ignored but the fetched ones still cached.
+    The third value is whether any list came from the cache.
+    """
+    scope = None if no_cache else getattr(provider, "cache_scope", None)
+
+    accts = cats = None
+    if scope and not refresh:
+        if want_accounts:
+            accts = cache.load("accounts", scope, LOOKUP_CACHE_TTL)
+        if want_categories:
+            cats = cache.load("categories", scope, LOOKUP_CACHE_TTL)
+    cached = accts is not None or cats is not None
+
+    fetch_accounts = want_accounts and accts is None
+    fetch_categories = want_categories and cats is None
+    if fetch_accounts and fetch_categories:
+        accts, cats = provider.get_accounts_and_categories()
+    elif fetch_accounts:
+        accts = provider.get_accounts()
+    elif fetch_categories:
+        cats = provider.get_categories()
+
+    # Only IDs and names are needed; keep balances and the like off disk
+    if scope and fetch_accounts:
+        cache.store("accounts", scope, _id_name_pairs(accts, "displayName"))
+    if scope and fetch_categories:
+        cache.store("categories", scope, _id_name_pairs(cats, "name"))
+    return accts, cats, cached
+
+
+def _id_name_pairs(records: list[dict], name_key: str) -> list[dict]:
+    """Strip records down to their ID and name field."""
+    return [{"id": r["id"], name_key: r[name_key]} for r in records]
+
+
+def _resolve_ids(records: list[dict], name_key: str, names: list[str]) -> list[str]:
+    """Return IDs of records whose name matches any of names (wildcards allowed)."""
+    matches = _names_matcher(tuple(names))
+    return [r["id"] for r in records if matches(r[name_key])]
+
+
+@functools.lru_cache(maxsize=32)
+def _names_matcher(names: tuple[str, ...]) -> Callable[[str], object]:
+    """Build one case-insensitive test for "matches any of names".
+
+    All-literal lists become a set lookup; otherwise every name, literal or
+    not, goes into a single union regex so each record is matched once.
+    """
+    if not any(_is_wildcard(n) for n in names):
+        literals = frozenset(n.lower() for n in names)
+        return lambda name: name.lower() in literals
+    return _compile_wildcard_union(tuple(sorted(set(names)))).match
+
+
+def _search_hint(merchant: Optional[str], notes: Optional[str]) -> Optional[str]:
+    """Return a server-side search term implied by the merchant and notes patterns.
+
+    The transactions search covers merchant names and notes, but whether it
+    matches substrings, words or prefixes is not known. So only text anchored
+    at the start of a field is sent: a literal pattern's whole value, or the
+    first word of a wildcard pattern's leading literal run. A fragment from
+    mid-pattern, such as "mazon" from "*mazon*", could make the server drop
+    real matches. Statement text (plaidName) is not searched, so
+    --original-statement never contributes.
+    """
+    hints = [_anchored_literal(p) for p in (merchant, notes) if p]
+    return max(hints, key=len, default="") or None
+
+
+def _anchored_literal(pattern: str) -> str:
+    """Return pattern if literal, else the first word before its first wildcard."""
+    if not _is_wildcard(pattern):
+        return pattern
+    words = _WILDCARD_SPLIT_RE.split(pattern, 1)[0].split()
+    return words[0] if words else ""
+
+
+def _find_id(records: list[dict], name_key: str, name: str) -> Optional[str]:
+    """Return the ID of the record named name, falling back to a partial match.
+
+    Matching is case-insensitive; the first record wins on duplicate names.
+    """
+    by_name: dict[str, str] = {}
+    for r in records:
+        by_name.setdefault(r[name_key].lower(), r["id"])
+    needle = name.lower()
+    found = by_name.get(needle)
+    if found is None:
+        found = next((rid for n, rid in by_name.items() if needle in n), None)
+    return found
+
+
+# Wildcard syntax separating the literal runs of an fnmatch pattern
+_WILDCARD_SPLIT_RE = re.compile(r"[*?]|\[[^\]]*\]")
+
+# Comma separator of a multi-value option, with the whitespace around it
+_MULTI_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# One ID in a comma-separated list; IDs never contain commas or whitespace
+_ID_TOKEN_RE = re.compile(r"[^,\s]+")
+
+# Numeric Monarch IDs or long opaque tokens; account names are shorter or contain spaces
+_ID_RE = re.compile(r"\d+|[A-Za-z0-9_-]{16,}")
 
 
-def _wildcard_match(text: str, pattern: str) -> bool:
-    """Match text against pattern with * wildcard support."""
-    return fnmatch.fnmatch(text.lower(), pattern.lower())
+def _looks_like_id(value: str) -> bool:
+    """Whether value is already an ID and needs no name lookup."""
+    return _ID_RE.fullmatch(value) is not None
+
+
+def _is_wildcard(pattern: str) -> bool:
+    """Whether pattern uses any fnmatch wildcard syntax."""
+    return any(c in pattern for c in "*?[")
 
 
 @transactions_group.command("get")
@@ -182,7 +396,7 @@ def _get_transaction(transaction_id: str, output_format: str) -> str:
         return json.dumps({"error": f"Transaction not found: {transaction_id}"})
 
     if output_format == "json":
-        return json.dumps(txn, indent=2, default=str)
+        return jsonutil.dumps(txn, indent=_pretty_json())
     else:
         return transactions.format_single_text(txn)
 
@@ -207,25 +421,42 @@ def mark_reviewed(transaction_ids: str, undo: bool, output_format: str):
 def _mark_reviewed(transaction_ids: str, undo: bool, output_format: str) -> str:
     """Implementation of mark-reviewed."""
     provider = get_provider()
-    ids = [id.strip() for id in transaction_ids.split(",") if id.strip()]
+    # Each ID once, so the batch's expected count matches what it can affect
+    ids = list(dict.fromkeys(_ID_TOKEN_RE.findall(transaction_ids)))
 
     if not ids:
         return json.dumps({"error": "No transaction IDs provided"})
 
     needs_review = undo  # --undo means set needsReview=True
-    results = []
-    for tid in ids:
-        try:
-            provider.update_transaction(transaction_id=tid, needs_review=needs_review)
-            results.append({"id": tid, "success": True})
-        except APIError as e:
-            results.append({"id": tid, "success": False, "error": str(e)})
+    try:
+        # One request for the whole batch instead of one per ID; its success
+        # flag is authoritative (affectedCount may leave out unchanged rows)
+        bulk_ok = bool(provider.bulk_update_transactions(ids, needs_review=needs_review).get("success"))
+    except APIError:
+        bulk_ok = False
+
+    if bulk_ok:
+        results = [{"id": tid, "success": True} for tid in ids]
+        success_count = len(ids)
+    else:
+        # Fall back to per-ID updates so each failure is reported individually
+        results = []
+        success_count = 0
+        for tid in ids:
+            try:
+                provider.update_transaction(transaction_id=tid, needs_review=needs_review)
+                results.append({"id": tid, "success": True})
+                success_count += 1
+            except (APIError, ValueError) as e:
+                results.append({"id": tid, "success": False, "error": str(e)})
 
-    success_count = sum(1 for r in results if r["success"])
     action = "needing review" if undo else "reviewed"
 
     if output_format == "json":
-        return json.dumps({"results": results, "success_count": success_count, "total": len(ids)}, indent=2)
+        return jsonutil.dumps(
+            {"results": results, "success_count": success_count, "total": len(ids)},
+            indent=_pretty_json(),
+        )
     else:
         return f"Marked {success_count}/{len(ids)} transactions as {action}"
 
@@ -263,7 +494,7 @@ def _split_transaction(transaction_id: str, splits: str, output_format: str) ->
     result = provider.split_transaction(transaction_id, split_data)
 
     if output_format == "json":
-        return json.dumps(result, indent=2, default=str)
+        return jsonutil.dumps(result, indent=_pretty_json())
     else:
         splits_info = result.get("splitTransactions", [])
         lines = [f"Transaction {transaction_id} split into {len(splits_info)} parts:"]
@@ -276,24 +507,27 @@ def _split_transaction(transaction_id: str, splits: str, output_format: str) ->
 
 
 @transactions_group.command("update")
-@click.argument("transaction_id")
+@click.argument("transaction_ids")
 @click.option("--category", help="Category name to set")
 @click.option("--merchant", help="Merchant name to set")
 @click.option("--notes", help="Notes to set (use empty string to clear)")
 @click.option("--needs-review", type=bool, default=None, help="Set needs review flag (true/false)")
 @click.option("--format", "output_format", type=click.Choice(["text", "json"]), default="text", help="Output format")
+@click.pass_obj
 def update_transaction(
-    transaction_id: str,
+    obj: dict,
+    transaction_ids: str,
     category: Optional[str],
     merchant: Optional[str],
     notes: Optional[str],
     needs_review: Optional[bool],
     output_format: str,
 ):
-    """Update a transaction by ID. Only specified fields are changed."""
+    """Update transactions by ID (comma-separated). Only specified fields are changed."""
     try:
         result = _update_transaction(
-            transaction_id, category, merchant, notes, needs_review, output_format
+            transaction_ids, category, merchant, notes, needs_review, output_format,
+            obj["no_cache"],
         )
         click.echo(result)
     except AuthenticationError as e:
@@ -302,6 +536,9 @@ def update_transaction(
     except APIError as e:
         click.echo(f"API error: {e}", err=True)
         sys.exit(1)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
 
 
 @transactions_group.command("create")
@@ -313,7 +550,9 @@ def update_transaction(
 @click.option("--notes", default="", help="Optional notes")
 @click.option("--update-balance", is_flag=True, help="Update account balance")
 @click.option("--format", "output_format", type=click.Choice(["text", "json"]), default="text", help="Output format")
+@click.pass_obj
 def create_transaction(
+    obj: dict,
     date: str,
     account: str,
     amount: float,
@@ -326,7 +565,8 @@ def create_transaction(
     """Create a new manual transaction."""
     try:
         result = _create_transaction(
-            date, account, amount, merchant, category, notes, update_balance, output_format
+            date, account, amount, merchant, category, notes, update_balance, output_format,
+            obj["no_cache"],
         )
         click.echo(result)
     except AuthenticationError as e:
@@ -346,31 +586,30 @@ def _create_transaction(
     notes: str,
     update_balance: bool,
     output_format: str,
+    no_cache: bool,
 ) -> str:
     """Implementation of create transaction."""
     provider = get_provider()
 
-    # Resolve account name to ID if not already an ID
-    account_id = account
-    if not account.isdigit():
-        accts = provider.get_accounts()
-        matching = [a for a in accts if a["displayName"].lower() == account.lower()]
-        if not matching:
-            # Try partial match
-            matching = [a for a in accts if account.lower() in a["displayName"].lower()]
-        if not matching:
-            return json.dumps({"error": f"Account not found: {account}"})
-        account_id = matching[0]["id"]
-
-    # Resolve category name to ID
-    cats = provider.get_categories()
-    matching_cat = [c for c in cats if c["name"].lower() == category.lower()]
-    if not matching_cat:
-        # Try partial match
-        matching_cat = [c for c in cats if category.lower() in c["name"].lower()]
-    if not matching_cat:
+    # Resolve the account name (unless already an ID) and category name to IDs
+    needs_account = not _looks_like_id(account)
+
+    def resolve(accts, cats):
+        account_id = _find_id(accts, "displayName", account) if needs_account else account
+        return account_id, _find_id(cats, "name", category)
+
+    want = (provider, needs_account, True, no_cache)
+    accts, cats, cached = _name_lookups(*want)
+    account_id, category_id = resolve(accts, cats)
+    if cached and None in (account_id, category_id):
+        # The name may be newer than the cached lists; retry once on fresh ones
+        accts, cats, _ = _name_lookups(*want, refresh=True)
+        account_id, category_id = resolve(accts, cats)
+
+    if account_id is None:
+        return json.dumps({"error": f"Account not found: {account}"})
+    if category_id is None:
         return json.dumps({"error": f"Category not found: {category}"})
-    category_id = matching_cat[0]["id"]
 
     # Create the transaction
     created = provider.create_transaction(
@@ -384,48 +623,65 @@ def _create_transaction(
     )
 
     if output_format == "json":
-        return json.dumps(created, indent=2, default=str)
+        return jsonutil.dumps(created, indent=_pretty_json())
     else:
         return transactions.format_single_text(created)
 
 
 def _update_transaction(
-    transaction_id: str,
+    transaction_ids: str,
     category: Optional[str],
     merchant: Optional[str],
     notes: Optional[str],
     needs_review: Optional[bool],
     output_format: str,
+    no_cache: bool,
 ) -> str:
     """Implementation of update transaction."""
     provider = get_provider()
+    ids = _ID_TOKEN_RE.findall(transaction_ids)
+
+    if not ids:
+        return json.dumps({"error": "No transaction IDs provided"})
 
-    # Resolve category name to ID if provided
+    # Resolve category name to ID if provided, once for every transaction
     category_id = None
     if category is not None:
-        cats = provider.get_categories()
-        matching = [c for c in cats if c["name"].lower() == category.lower()]
-        if not matching:
-            # Try partial match
-            matching = [c for c in cats if category.lower() in c["name"].lower()]
-        if not matching:
+        _, cats, cached = _name_lookups(provider, False, True, no_cache)
+        category_id = _find_id(cats, "name", category)
+        if category_id is None and cached:
+            # The name may be newer than the cached list; retry once on a fresh one
+            _, cats, _ = _name_lookups(provider, False, True, no_cache, refresh=True)
+            category_id = _find_id(cats, "name", category)
+        if category_id is None:
             return json.dumps({"error": f"Category not found: {category}"})
-        category_id = matching[0]["id"]
 
     # Perform update
-    updated = provider.update_transaction(
-        transaction_id=transaction_id,
-        category_id=category_id,
-        merchant_name=merchant,
-        notes=notes,
-        needs_review=needs_review,
-    )
+    if len(ids) == 1:
+        updated = provider.update_transaction(
+            transaction_id=ids[0],
+            category_id=category_id,
+            merchant_name=merchant,
+            notes=notes,
+            needs_review=needs_review,
+        )
+    else:
+        # One batched request for all IDs instead of one per transaction
+        updated = provider.update_transactions(
+            ids,
+            category_id=category_id,
+            merchant_name=merchant,
+            notes=notes,
+            needs_review=needs_review,
+        )
 
     # Format output
     if output_format == "json":
-        return json.dumps(updated, indent=2, default=str)
-    else:
+        return jsonutil.dumps(updated, indent=_pretty_json())
+    elif len(ids) == 1:
         return transactions.format_single_text(updated)
+    else:
+        return "\n\n".join(transactions.format_single_text(t) for t in updated)
 
 
 @cli.group("recurring", invoke_without_command=True)
@@ -526,7 +782,7 @@ def recurring_remove(stream_id: str):
         sys.exit(1)
 
 
-def _list_recurring(output_format: str) -> str:
+def _list_recurring(output_format: str) -> Union[str, bytes]:
     """Implementation of list recurring."""
     provider = get_provider()
 
@@ -539,7 +795,7 @@ def _list_recurring(output_format: str) -> str:
     streams = recurring.collapse_to_streams(items)
 
     if output_format == "json":
-        return json.dumps(streams, indent=2, default=str)
+        return jsonutil.dumpb(streams, indent=_pretty_json())
     elif output_format == "csv":
         return recurring.format_csv(streams)
     else:
@@ -561,13 +817,13 @@ def list_accounts(output_format: str):
         sys.exit(1)
 
 
-def _list_accounts(output_format: str) -> str:
+def _list_accounts(output_format: str) -> Union[str, bytes]:
     """Implementation of list accounts."""
     provider = get_provider()
     accts = provider.get_accounts()
 
     if output_format == "json":
-        return json.dumps(accts, indent=2, default=str)
+        return jsonutil.dumpb(accts, indent=_pretty_json())
     elif output_format == "csv":
         return accounts.format_csv(accts)
     else:
@@ -589,34 +845,47 @@ def list_categories(output_format: str):
         sys.exit(1)
 
 
-def _list_categories(output_format: str) -> str:
+def _list_categories(output_format: str) -> Union[str, bytes]:
     """Implementation of list categories."""
     provider = get_provider()
     cats = provider.get_categories()
 
     if output_format == "json":
-        return json.dumps(cats, indent=2, default=str)
+        return jsonutil.dumpb(cats, indent=_pretty_json())
     else:
         # Text format - group by category group
         lines = []
         lines.append(f"CATEGORIES ({len(cats)})")
         lines.append("-" * 40)
 
-        by_group: dict[str, list] = {}
-        for cat in cats:
-            group_name = cat.get("group", {}).get("name", "Other")
-            by_group.setdefault(group_name, []).append(cat)
-
-        for group_name in sorted(by_group.keys()):
-            group_cats = by_group[group_name]
-            group_type = group_cats[0].get("group", {}).get("type", "")
+        # One sort on (group, name) yields each group as a contiguous run
+        keyed = sorted(
+            ((cat.get("group", {}).get("name", "Other"), cat["name"], cat) for cat in cats),
+            key=lambda k: k[:2],
+        )
+        for group_name, run in itertools.groupby(keyed, key=lambda k: k[0]):
+            first = next(run)
+            group_type = first[2].get("group", {}).get("type", "")
             lines.append(f"\n[{group_name}] ({group_type})")
-            for cat in sorted(group_cats, key=lambda c: c["name"]):
-                lines.append(f"  {cat['name']}")
+            lines.append(f"  {first[1]}")
+            lines.extend(f"  {name}" for _, name, _ in run)
 
         return "\n".join(lines)
 
 
+@cli.group("cache")
+def cache_group():
+    """Local cache commands."""
+    pass
+
+
+@cache_group.command("clear")
+def cache_clear():
+    """Delete cached account and category lists."""
+    removed = cache.clear()
+    click.echo(f"Removed {removed} cache file(s)")
+
+
 @cli.command("auth")
 @click.argument("token")
 def auth(token: str):
@@ -642,14 +911,14 @@ def net_worth_cmd(output_format: str):
         sys.exit(1)
 
 
-def _net_worth(output_format: str) -> str:
+def _net_worth(output_format: str) -> Union[str, bytes]:
     """Implementation of net worth."""
     provider = get_provider()
     accts = provider.get_accounts()
     report = net_worth.build_report(accts)
 
     if output_format == "json":
-        return json.dumps(report, indent=2)
+        return jsonutil.dumpb(report, indent=_pretty_json())
     elif output_format == "csv":
         return net_worth.format_csv(report)
     else:
@@ -3,8 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
-import aiohttp
-
+from . import jsonutil
 from .config import get_token, get_token_file, save_token as config_save_token
 
 GRAPHQL_URL = "https://api.monarch.com/graphql"
@@ -43,6 +42,26 @@ class MonarchClient:
     ):
         self._token = token or get_token()
         self._token_file = get_token_file()
+        # Request headers are fixed for the client's lifetime; build them once
+        self._headers = {**HEADERS, "Authorization": f"Token {self._token}"} if self._token else None
+        # Session shared by requests made inside "async with client:"
+        self._session = None
+        self._session_depth = 0
+
+    async def __aenter__(self) -> "MonarchClient":
+        """Open a shared HTTP session so requests reuse pooled connections."""
+        if self._session_depth == 0:
+            import aiohttp
+            self._session = aiohttp.ClientSession()
+        self._session_depth += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the shared session when the outermost block exits."""
+        self._session_depth -= 1
+        if self._session_depth == 0:
+            session, self._session = self._session, None
+            await session.close()
 
     def save_token(self) -> None:
         """Save token to file."""
@@ -64,21 +83,54 @@ class MonarchClient:
                 "3. Run: JSON.parse(JSON.parse(localStorage.getItem('persist:root')).user).token"
             )
 
-        headers = {**HEADERS, "Authorization": f"Token {self._token}"}
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
 
+        if self._session is not None:
+            return await self._post(self._session, payload, self._headers)
+
+        # Lazy import keeps aiohttp off the startup path of commands that never
+        # reach the network (--help, auth, the local provider)
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
-            async with session.post(GRAPHQL_URL, json=payload, headers=headers) as resp:
-                if resp.status == 401:
-                    raise AuthenticationError("Invalid or expired token")
-                if resp.status != 200:
-                    text = await resp.text()
-                    raise APIError(f"HTTP {resp.status}: {text[:200]}")
-
-                data = await resp.json()
-                if "errors" in data:
-                    raise APIError(f"GraphQL error: {data['errors']}")
-
-                return data.get("data", {})
+            return await self._post(session, payload, self._headers)
+
+    async def _post(self, session, payload: dict, headers: dict) -> dict:
+        # Encode the body ourselves (orjson when available, one compact pass
+        # over the query text); HEADERS already sets the JSON content type
+        body = jsonutil.dumpb(payload, indent=False)
+        async with session.post(GRAPHQL_URL, data=body, headers=headers) as resp:
+            if resp.status == 401:
+                raise AuthenticationError("Invalid or expired token")
+            if resp.status != 200:
+                text = await resp.text()
+                raise APIError(f"HTTP {resp.status}: {text[:200]}")
+
+            # Parse the raw body ourselves so orjson is used when available
+            try:
+                data = jsonutil.loads(await resp.read())
+            except ValueError as e:
+                raise APIError(f"Invalid JSON response: {e}") from e
+            if "errors" in data:
+                raise APIError(f"GraphQL error: {data['errors']}")
+
+            return data.get("data", {})
+
+
+# Client shared process-wide by callers that don't supply their own token
+_default_client: Optional[MonarchClient] = None
+
+
+def get_default_client() -> MonarchClient:
+    """Get the shared client for the configured token, creating it on first use.
+
+    The token is resolved once and the client reused by every provider built
+    in the same process. A client without a token is not kept, so a token
+    saved later is still picked up.
+    """
+    global _default_client
+    if _default_client is None or not _default_client.is_authenticated:
+        _default_client = MonarchClient()
+    return _default_client
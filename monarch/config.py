@@ -32,6 +32,18 @@ def get_token_file() -> Path:
     return get_config_dir() / "token"
 
 
+def get_cache_dir() -> Path:
+    """Get the cache directory path.
+
+    Respects MONARCH_CACHE_DIR environment variable if set,
+    otherwise uses {config_dir}/cache
+    """
+    env_path = os.getenv("MONARCH_CACHE_DIR")
+    if env_path:
+        return Path(env_path)
+    return get_config_dir() / "cache"
+
+
 def get_token() -> str | None:
     """Get the authentication token.
 
@@ -46,12 +58,11 @@ def get_token() -> str | None:
     if token:
         return token.strip()
 
-    # Fall back to token file
-    token_file = get_token_file()
-    if token_file.exists():
-        return token_file.read_text().strip()
-
-    return None
+    # Fall back to token file (one open instead of a stat then an open)
+    try:
+        return get_token_file().read_text().strip()
+    except FileNotFoundError:
+        return None
 
 
 def save_token(token: str) -> Path:
@@ -0,0 +1,42 @@
+"""JSON encoding helpers.
+
+Uses orjson when it is installed (pip install 'monarch-access[fast]'),
+falling back to the standard library otherwise; orjson is considerably
+faster on large result sets. Both write non-ASCII characters unescaped.
+Output can still differ for values JSON has no type for: orjson encodes
+datetimes itself (RFC 3339), where the fallback uses str().
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize obj as JSON, stringifying unknown types."""
+    return dumpb(obj, indent).decode()
+
+
+def dumpb(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj as UTF-8 JSON bytes, indented unless indent is False.
+
+    Writing the bytes straight to a binary stream (click.echo does this for
+    bytes) skips the decode/re-encode round trip of a large str.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, default=str, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), default=str, ensure_ascii=False).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
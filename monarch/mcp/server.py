@@ -16,19 +16,19 @@ from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from ..accounts import get_accounts
+from ..categories import get_categories
 from ..client import MonarchClient, AuthenticationError, APIError
+from ..recurring import get_recurring_transaction_items
 from ..queries import (
-    ACCOUNTS_QUERY,
     BULK_UPDATE_TRANSACTIONS_MUTATION,
     CREATE_TRANSACTION_MUTATION,
     DELETE_TRANSACTION_MUTATION,
-    GET_TRANSACTION_QUERY,
-    RECURRING_TRANSACTION_ITEMS_QUERY,
     SPLIT_TRANSACTION_MUTATION,
-    TRANSACTION_CATEGORIES_QUERY,
-    TRANSACTIONS_QUERY,
-    UPDATE_TRANSACTION_MUTATION,
 )
+from ..transactions.get import get_transaction
+from ..transactions.list import get_transactions
+from ..transactions.update import update_transaction
 
 # Initialize logging
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -65,99 +65,6 @@ def _get_client() -> MonarchClient:
 # --- Async API helpers ---
 
 
-async def get_accounts(client: MonarchClient) -> list[dict]:
-    """Get all accounts."""
-    data = await client._request(ACCOUNTS_QUERY)
-    return data.get("accounts", [])
-
-
-async def get_categories(client: MonarchClient) -> list[dict]:
-    """Get all transaction categories."""
-    data = await client._request(TRANSACTION_CATEGORIES_QUERY)
-    return data.get("categories", [])
-
-
-async def get_transactions(
-    client: MonarchClient,
-    limit: int = 100,
-    offset: int = 0,
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    account_ids: Optional[list[str]] = None,
-    category_ids: Optional[list[str]] = None,
-    search: Optional[str] = None,
-) -> dict:
-    """Get transactions with optional filters."""
-    variables: dict[str, Any] = {
-        "limit": limit,
-        "offset": offset,
-        "filters": {
-            "accounts": account_ids or [],
-            "categories": category_ids or [],
-        }
-    }
-
-    if search:
-        variables["filters"]["search"] = search
-    if start_date:
-        variables["filters"]["startDate"] = start_date
-    if end_date:
-        variables["filters"]["endDate"] = end_date
-
-    data = await client._request(TRANSACTIONS_QUERY, variables)
-    return data.get("allTransactions", {"totalCount": 0, "results": []})
-
-
-async def get_transaction(client: MonarchClient, transaction_id: str) -> Optional[dict]:
-    """Get a single transaction by ID."""
-    data = await client._request(GET_TRANSACTION_QUERY, {"id": transaction_id})
-    return data.get("getTransaction")
-
-
-async def update_transaction(
-    client: MonarchClient,
-    transaction_id: str,
-    category_id: Optional[str] = None,
-    merchant_name: Optional[str] = None,
-    notes: Optional[str] = None,
-    amount: Optional[float] = None,
-    date: Optional[str] = None,
-    hide_from_reports: Optional[bool] = None,
-    needs_review: Optional[bool] = None,
-) -> dict:
-    """Update a transaction."""
-    variables: dict[str, Any] = {
-        "input": {
-            "id": transaction_id,
-        }
-    }
-
-    if category_id is not None:
-        variables["input"]["category"] = category_id
-    if merchant_name is not None:
-        variables["input"]["name"] = merchant_name
-    if notes is not None:
-        variables["input"]["notes"] = notes
-    if amount is not None:
-        variables["input"]["amount"] = amount
-    if date is not None:
-        variables["input"]["date"] = date
-    if hide_from_reports is not None:
-        variables["input"]["hideFromReports"] = hide_from_reports
-    if needs_review is not None:
-        variables["input"]["needsReview"] = needs_review
-
-    data = await client._request(UPDATE_TRANSACTION_MUTATION, variables)
-    result = data.get("updateTransaction", {})
-
-    if result.get("errors"):
-        errors = result["errors"]
-        msg = errors.get("message") or str(errors.get("fieldErrors", []))
-        raise APIError(f"Update failed: {msg}")
-
-    return result.get("transaction", {})
-
-
 async def bulk_update_transactions(
     client: MonarchClient,
     transaction_ids: list[str],
@@ -174,6 +81,8 @@ async def bulk_update_transactions(
     if hide_from_reports is not None:
         updates["hide"] = hide_from_reports
 
+    # Each transaction counts once towards the expected affected count
+    transaction_ids = list(dict.fromkeys(transaction_ids))
     variables = {
         "selectedTransactionIds": transaction_ids,
         "excludedTransactionIds": [],
@@ -217,21 +126,6 @@ async def split_transaction(
     return result.get("transaction", {})
 
 
-async def get_recurring_transaction_items(
-    client: MonarchClient,
-    start_date: str,
-    end_date: str,
-) -> list[dict]:
-    """Get recurring transaction items for a date range."""
-    variables: dict[str, Any] = {
-        "startDate": start_date,
-        "endDate": end_date,
-    }
-
-    data = await client._request(RECURRING_TRANSACTION_ITEMS_QUERY, variables)
-    return data.get("recurringTransactionItems", [])
-
-
 async def create_transaction(
     client: MonarchClient,
     date: str,
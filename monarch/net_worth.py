@@ -1,13 +1,41 @@
 """Net worth report generation."""
 
 import csv
+import functools
 import io
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Optional, TextIO
 
+# Ages beyond which a linked account's last sync counts as recent, then stale
+RECENT_AGE = timedelta(days=1)
+STALE_AGE = timedelta(days=7)
 
-def get_sync_status(account: dict) -> str:
-    """Determine sync status from account fields."""
+# Text report tables: account, institution and balance columns. The separator
+# and row format are built once; precision truncates cells to their width
+_TABLE_WIDTHS = (30, 20, 14)
+_TABLE_SEPARATOR = "+" + "+".join("-" * (w + 2) for w in _TABLE_WIDTHS) + "+"
+_TABLE_ROW = "| {:<30.30} | {:<20.20} | {:>14.14} |".format
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO-8601 timestamp; accounts synced together share one."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+@functools.lru_cache(maxsize=1)
+def _age_cutoffs(now: datetime) -> tuple[datetime, datetime]:
+    """Sync times before which an account is stale, and before which it is only recent."""
+    return now - STALE_AGE, now - RECENT_AGE
+
+
+def get_sync_status(account: dict, now: Optional[datetime] = None) -> str:
+    """Determine sync status from account fields.
+
+    now is an aware "current time" to share one clock reading across many
+    accounts; it defaults to reading the clock per call.
+    """
     if account.get("isManual"):
         return "manual"
     if account.get("syncDisabled"):
@@ -22,11 +50,13 @@ def get_sync_status(account: dict) -> str:
     last_updated = account.get("displayLastUpdatedAt")
     if last_updated:
         try:
-            updated_dt = datetime.fromisoformat(last_updated.replace("Z", "+00:00"))
-            now = datetime.now(updated_dt.tzinfo)
-            if now - updated_dt > timedelta(days=7):
+            updated_dt = _parse_iso(last_updated)
+            if now is None or updated_dt.tzinfo is None:
+                now = datetime.now(updated_dt.tzinfo)
+            stale_before, recent_before = _age_cutoffs(now)
+            if updated_dt < stale_before:
                 return "stale"
-            elif now - updated_dt > timedelta(days=1):
+            elif updated_dt < recent_before:
                 return "recent"
             else:
                 return "current"
@@ -35,46 +65,60 @@ def get_sync_status(account: dict) -> str:
     return "unknown"
 
 
+def _abs_balance(account_entry: dict) -> float:
+    """Sort key ranking report accounts by balance size."""
+    return abs(account_entry["balance"])
+
+
 def build_report(accounts: list) -> dict:
     """Build structured net worth report from accounts data."""
-    nw_accounts = [a for a in accounts if a.get("includeInNetWorth", True)]
-
+    now = datetime.now(timezone.utc)
+    # Accounts and balance sums per category, both built in the one pass
     assets_by_category = defaultdict(list)
     liabilities_by_category = defaultdict(list)
+    asset_totals = defaultdict(float)
+    liability_totals = defaultdict(float)
 
-    for acc in nw_accounts:
-        is_asset = acc.get("isAsset", True)
-        acc_type = acc.get("type", {}).get("display", "Other")
-        balance = acc.get("currentBalance", 0) or 0
+    for acc in accounts:
+        if not acc.get("includeInNetWorth", True):
+            continue
+
+        acc_type = (acc.get("type") or {}).get("display", "Other")
+        balance = round(acc.get("currentBalance", 0) or 0, 2)
 
         account_entry = {
             "name": acc.get("displayName", "Unknown"),
             "mask": acc.get("mask"),
-            "balance": round(balance, 2),
+            "balance": balance,
             "institution": (acc.get("institution") or {}).get("name"),
             "subtype": (acc.get("subtype") or {}).get("display"),
-            "sync_status": get_sync_status(acc),
+            "sync_status": get_sync_status(acc, now),
             "last_updated": acc.get("displayLastUpdatedAt"),
         }
 
-        if is_asset:
+        if acc.get("isAsset", True):
             assets_by_category[acc_type].append(account_entry)
+            asset_totals[acc_type] += balance
         else:
             liabilities_by_category[acc_type].append(account_entry)
+            liability_totals[acc_type] += balance
 
-    def build_categories(grouped: dict) -> list:
-        categories = []
-        for cat_name, accts in sorted(grouped.items()):
-            cat_total = sum(a["balance"] for a in accts)
-            categories.append({
+    def build_categories(grouped: dict, totals: dict) -> list:
+        categories = [
+            {
                 "category": cat_name,
-                "total": round(cat_total, 2),
-                "accounts": sorted(accts, key=lambda x: -abs(x["balance"]))
-            })
-        return sorted(categories, key=lambda x: -abs(x["total"]))
-
-    asset_categories = build_categories(assets_by_category)
-    liability_categories = build_categories(liabilities_by_category)
+                "total": round(totals[cat_name], 2),
+                # reverse keeps the sort stable: equal balances stay in API order
+                "accounts": sorted(accts, key=_abs_balance, reverse=True),
+            }
+            for cat_name, accts in grouped.items()
+        ]
+        # Largest categories first, ties by name, in one sort
+        categories.sort(key=lambda c: (-abs(c["total"]), c["category"]))
+        return categories
+
+    asset_categories = build_categories(assets_by_category, asset_totals)
+    liability_categories = build_categories(liabilities_by_category, liability_totals)
 
     assets_total = sum(c["total"] for c in asset_categories)
     liabilities_total = sum(abs(c["total"]) for c in liability_categories)
@@ -93,56 +137,57 @@ def build_report(accounts: list) -> dict:
     }
 
 
+def _fmt_money(amount: float) -> str:
+    """Format amount as currency string."""
+    if amount < 0:
+        return f"-${abs(amount):,.2f}"
+    return f"${amount:,.2f}"
+
+
 def format_csv(report: dict) -> str:
     """Format net worth report as CSV."""
     output = io.StringIO()
-    fieldnames = ["section", "category", "account", "institution", "balance", "sync_status"]
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
+    write_csv(report, output)
+    return output.getvalue()
+
+
+def write_csv(report: dict, out: TextIO) -> None:
+    """Write net worth report as CSV to a text stream."""
+    writer = csv.writer(out)
+    writer.writerow(("section", "category", "account", "institution", "balance", "sync_status"))
 
     for section, label in [("assets", "Asset"), ("liabilities", "Liability")]:
         for cat in report[section]["categories"]:
-            for acc in cat["accounts"]:
-                writer.writerow({
-                    "section": label,
-                    "category": cat["category"],
-                    "account": acc["name"],
-                    "institution": acc.get("institution") or "",
-                    "balance": acc["balance"],
-                    "sync_status": acc.get("sync_status", ""),
-                })
-
-    return output.getvalue()
+            category = cat["category"]
+            writer.writerows(
+                (
+                    label,
+                    category,
+                    acc["name"],
+                    acc.get("institution") or "",
+                    acc["balance"],
+                    acc.get("sync_status", ""),
+                )
+                for acc in cat["accounts"]
+            )
 
 
 def format_text(report: dict) -> str:
     """Format net worth report as ASCII text with tables."""
     lines = []
 
-    def fmt_money(amount: float) -> str:
-        """Format amount as currency string."""
-        if amount < 0:
-            return f"-${abs(amount):,.2f}"
-        return f"${amount:,.2f}"
-
-    def make_table(rows: list[tuple], col_widths: list[int], alignments: list[str]) -> list[str]:
-        """Create ASCII table rows. alignments: 'l' for left, 'r' for right."""
-        result = []
-        separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
-        result.append(separator)
-        for i, row in enumerate(rows):
-            cells = []
-            for val, width, align in zip(row, col_widths, alignments):
-                text = str(val)[:width]
-                if align == "r":
-                    cells.append(f" {text:>{width}} ")
-                else:
-                    cells.append(f" {text:<{width}} ")
-            result.append("|" + "|".join(cells) + "|")
-            if i == 0:
-                result.append(separator)
-        result.append(separator)
-        return result
+    def add_table(categories: list) -> None:
+        """Append an ASCII table of categories and their accounts to lines."""
+        lines.append(_TABLE_SEPARATOR)
+        lines.append(_TABLE_ROW("Account", "Institution", "Balance"))
+        lines.append(_TABLE_SEPARATOR)
+        for cat in categories:
+            lines.append(_TABLE_ROW(f"[{cat['category']}]", "", _fmt_money(cat["total"])))
+            lines.extend(
+                _TABLE_ROW(f"  {acc['name']}", acc.get("institution") or "", _fmt_money(acc["balance"]))
+                for acc in cat["accounts"]
+            )
+        lines.append(_TABLE_SEPARATOR)
 
     # Header
     lines.append(f"Net Worth Report - {report['date']}")
@@ -150,42 +195,20 @@ def format_text(report: dict) -> str:
     lines.append("")
 
     # Summary
-    lines.append(f"NET WORTH: {fmt_money(report['net_worth'])}")
-    lines.append(f"  Assets:      {fmt_money(report['assets']['total'])}")
-    lines.append(f"  Liabilities: {fmt_money(report['liabilities']['total'])}")
+    lines.append(f"NET WORTH: {_fmt_money(report['net_worth'])}")
+    lines.append(f"  Assets:      {_fmt_money(report['assets']['total'])}")
+    lines.append(f"  Liabilities: {_fmt_money(report['liabilities']['total'])}")
     lines.append("")
 
     # Assets table
     if report["assets"]["categories"]:
         lines.append("ASSETS")
-
-        col_widths = [30, 20, 14]
-        alignments = ["l", "l", "r"]
-        rows = [("Account", "Institution", "Balance")]
-
-        for cat in report["assets"]["categories"]:
-            rows.append((f"[{cat['category']}]", "", fmt_money(cat["total"])))
-            for acc in cat["accounts"]:
-                inst = acc.get("institution") or ""
-                rows.append((f"  {acc['name']}", inst[:20], fmt_money(acc["balance"])))
-
-        lines.extend(make_table(rows, col_widths, alignments))
+        add_table(report["assets"]["categories"])
         lines.append("")
 
     # Liabilities table
     if report["liabilities"]["categories"]:
         lines.append("LIABILITIES")
-
-        col_widths = [30, 20, 14]
-        alignments = ["l", "l", "r"]
-        rows = [("Account", "Institution", "Balance")]
-
-        for cat in report["liabilities"]["categories"]:
-            rows.append((f"[{cat['category']}]", "", fmt_money(cat["total"])))
-            for acc in cat["accounts"]:
-                inst = acc.get("institution") or ""
-                rows.append((f"  {acc['name']}", inst[:20], fmt_money(acc["balance"])))
-
-        lines.extend(make_table(rows, col_widths, alignments))
+        add_table(report["liabilities"]["categories"])
 
     return "\n".join(lines)
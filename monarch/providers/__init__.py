@@ -5,9 +5,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union
 
 from .base import Provider, TransactionsProvider, AccountsProvider, CategoriesProvider, RecurringProvider
-from .api import APIProvider
 
 if TYPE_CHECKING:
+    from .api import APIProvider
     from .local import LocalProvider
 
 __all__ = [
@@ -29,7 +29,7 @@ LOCAL_DB_PATH_ENV_VAR = "MONARCH_LOCAL_DB"
 def get_provider(
     provider_type: Optional[str] = None,
     db_path: Optional[Path] = None,
-) -> Union[APIProvider, "LocalProvider"]:
+) -> Union["APIProvider", "LocalProvider"]:
     """Get a provider instance based on configuration.
 
     Provider selection priority:
@@ -58,6 +58,19 @@ def get_provider(
                 db_path = Path(env_path)
         return LocalProvider(db_path)
     elif provider_type == "api":
+        # Lazy import keeps asyncio off the startup path of `--help` and local runs
+        from .api import APIProvider
         return APIProvider()
     else:
         raise ValueError(f"Unknown provider type: {provider_type}. Use 'api' or 'local'.")
+
+
+def __getattr__(name: str):
+    # Provider classes are imported on first access, not with the package
+    if name == "APIProvider":
+        from .api import APIProvider
+        return APIProvider
+    if name == "LocalProvider":
+        from .local import LocalProvider
+        return LocalProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
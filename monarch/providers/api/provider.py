@@ -1,31 +1,68 @@
 """Monarch API provider implementation."""
 
 import asyncio
+import atexit
 from typing import Any, Optional
 
-from ...client import MonarchClient, APIError
+from ... import accounts, cache, categories
+from ...recurring import get_recurring_transaction_items
+from ...transactions.get import get_transaction
+from ...transactions.list import get_transactions
+from ...transactions.update import update_transaction, update_transactions
+from ...client import MonarchClient, APIError, get_default_client
 from ...queries import (
-    ACCOUNTS_QUERY,
     BULK_UPDATE_TRANSACTIONS_MUTATION,
     CREATE_TRANSACTION_MUTATION,
-    GET_TRANSACTION_QUERY,
-    RECURRING_TRANSACTION_ITEMS_QUERY,
     SPLIT_TRANSACTION_MUTATION,
-    TRANSACTION_CATEGORIES_QUERY,
-    TRANSACTIONS_QUERY,
-    UPDATE_TRANSACTION_MUTATION,
 )
 
+# Event loop shared by every APIProvider in the process, and the clients whose
+# sessions stay open on it; both are closed at interpreter exit
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_open_clients: list[MonarchClient] = []
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared event loop, creating it on first use."""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        atexit.register(_close_loop)
+    return _loop
+
+
+def _close_loop() -> None:
+    """Close the sessions opened on the shared loop, then the loop itself."""
+    global _loop
+    loop, _loop = _loop, None
+    if loop is None:
+        return
+    while _open_clients:
+        loop.run_until_complete(_open_clients.pop().__aexit__(None, None, None))
+    loop.close()
+
 
 class APIProvider:
     """Provider that connects to the Monarch Money API."""
 
     def __init__(self, client: Optional[MonarchClient] = None):
-        self._client = client or MonarchClient()
+        self._client = client or get_default_client()
+
+    @property
+    def cache_scope(self) -> Optional[str]:
+        """Scope for on-disk lookup caches of this login's data (None without a token)."""
+        token = self._client._token
+        return cache.scope_for_token(token) if token else None
 
     def _run(self, coro):
         """Run async coroutine synchronously."""
-        return asyncio.run(coro)
+        # One loop and one open session per client for the whole process, so
+        # successive calls reuse pooled connections instead of new handshakes
+        loop = _get_loop()
+        if self._client not in _open_clients:
+            loop.run_until_complete(self._client.__aenter__())
+            _open_clients.append(self._client)
+        return loop.run_until_complete(coro)
 
     def get_transactions(
         self,
@@ -38,46 +75,13 @@ class APIProvider:
         search: Optional[str] = None,
     ) -> dict:
         """Get transactions with optional filters."""
-        return self._run(self._get_transactions(
-            limit, offset, start_date, end_date, account_ids, category_ids, search
+        return self._run(get_transactions(
+            self._client, limit, offset, start_date, end_date, account_ids, category_ids, search
         ))
 
-    async def _get_transactions(
-        self,
-        limit: int,
-        offset: int,
-        start_date: Optional[str],
-        end_date: Optional[str],
-        account_ids: Optional[list[str]],
-        category_ids: Optional[list[str]],
-        search: Optional[str],
-    ) -> dict:
-        variables: dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-            "filters": {
-                "accounts": account_ids or [],
-                "categories": category_ids or [],
-            }
-        }
-
-        if search:
-            variables["filters"]["search"] = search
-        if start_date:
-            variables["filters"]["startDate"] = start_date
-        if end_date:
-            variables["filters"]["endDate"] = end_date
-
-        data = await self._client._request(TRANSACTIONS_QUERY, variables)
-        return data.get("allTransactions", {"totalCount": 0, "results": []})
-
     def get_transaction(self, transaction_id: str) -> Optional[dict]:
         """Get a single transaction by ID."""
-        return self._run(self._get_transaction(transaction_id))
-
-    async def _get_transaction(self, transaction_id: str) -> Optional[dict]:
-        data = await self._client._request(GET_TRANSACTION_QUERY, {"id": transaction_id})
-        return data.get("getTransaction")
+        return self._run(get_transaction(self._client, transaction_id))
 
     def update_transaction(
         self,
@@ -91,52 +95,27 @@ class APIProvider:
         needs_review: Optional[bool] = None,
     ) -> dict:
         """Update a transaction. Only provided fields are updated."""
-        return self._run(self._update_transaction(
-            transaction_id, category_id, merchant_name, notes,
+        return self._run(update_transaction(
+            self._client, transaction_id, category_id, merchant_name, notes,
             amount, date, hide_from_reports, needs_review
         ))
 
-    async def _update_transaction(
+    def update_transactions(
         self,
-        transaction_id: str,
-        category_id: Optional[str],
-        merchant_name: Optional[str],
-        notes: Optional[str],
-        amount: Optional[float],
-        date: Optional[str],
-        hide_from_reports: Optional[bool],
-        needs_review: Optional[bool],
-    ) -> dict:
-        variables: dict[str, Any] = {
-            "input": {
-                "id": transaction_id,
-            }
-        }
-
-        if category_id is not None:
-            variables["input"]["category"] = category_id
-        if merchant_name is not None:
-            variables["input"]["name"] = merchant_name
-        if notes is not None:
-            variables["input"]["notes"] = notes
-        if amount is not None:
-            variables["input"]["amount"] = amount
-        if date is not None:
-            variables["input"]["date"] = date
-        if hide_from_reports is not None:
-            variables["input"]["hideFromReports"] = hide_from_reports
-        if needs_review is not None:
-            variables["input"]["needsReview"] = needs_review
-
-        data = await self._client._request(UPDATE_TRANSACTION_MUTATION, variables)
-        result = data.get("updateTransaction", {})
-
-        if result.get("errors"):
-            errors = result["errors"]
-            msg = errors.get("message") or str(errors.get("fieldErrors", []))
-            raise APIError(f"Update failed: {msg}")
-
-        return result.get("transaction", {})
+        transaction_ids: list[str],
+        category_id: Optional[str] = None,
+        merchant_name: Optional[str] = None,
+        notes: Optional[str] = None,
+        amount: Optional[float] = None,
+        date: Optional[str] = None,
+        hide_from_reports: Optional[bool] = None,
+        needs_review: Optional[bool] = None,
+    ) -> list[dict]:
+        """Apply the same update to several transactions in one request."""
+        return self._run(update_transactions(
+            self._client, transaction_ids, category_id, merchant_name, notes,
+            amount, date, hide_from_reports, needs_review
+        ))
 
     def bulk_update_transactions(
         self,
@@ -165,6 +144,8 @@ class APIProvider:
         if hide_from_reports is not None:
             updates["hide"] = hide_from_reports
 
+        # Each transaction counts once towards the expected affected count
+        transaction_ids = list(dict.fromkeys(transaction_ids))
         variables = {
             "selectedTransactionIds": transaction_ids,
             "excludedTransactionIds": [],
@@ -188,16 +169,24 @@ class APIProvider:
         return self._run(self._get_accounts())
 
     async def _get_accounts(self) -> list[dict]:
-        data = await self._client._request(ACCOUNTS_QUERY)
-        return data.get("accounts", [])
+        return await accounts.get_accounts(self._client)
 
     def get_categories(self) -> list[dict]:
         """Get all transaction categories."""
         return self._run(self._get_categories())
 
     async def _get_categories(self) -> list[dict]:
-        data = await self._client._request(TRANSACTION_CATEGORIES_QUERY)
-        return data.get("categories", [])
+        return await categories.get_categories(self._client)
+
+    def get_accounts_and_categories(self) -> tuple[list[dict], list[dict]]:
+        """Get all accounts and categories, fetched concurrently."""
+        return self._run(self._get_accounts_and_categories())
+
+    async def _get_accounts_and_categories(self) -> tuple[list[dict], list[dict]]:
+        accts, cats = await asyncio.gather(
+            self._get_accounts(), self._get_categories()
+        )
+        return accts, cats
 
     def split_transaction(
         self,
@@ -247,20 +236,7 @@ class APIProvider:
         end_date: str,
     ) -> list[dict]:
         """Get recurring transaction items for a date range."""
-        return self._run(self._get_recurring_transaction_items(start_date, end_date))
-
-    async def _get_recurring_transaction_items(
-        self,
-        start_date: str,
-        end_date: str,
-    ) -> list[dict]:
-        variables = {
-            "startDate": start_date,
-            "endDate": end_date,
-        }
-
-        data = await self._client._request(RECURRING_TRANSACTION_ITEMS_QUERY, variables)
-        return data.get("recurringTransactionItems", [])
+        return self._run(get_recurring_transaction_items(self._client, start_date, end_date))
 
     def update_recurring(self, stream_id: str, *, status=None, amount=None, frequency=None) -> dict:
         """Update a recurring stream's status, amount, or frequency."""
@@ -334,3 +310,13 @@ class APIProvider:
             raise APIError(f"Create transaction failed: {msg}")
 
         return result.get("transaction", {})
+
+    def close(self):
+        """Close the HTTP session kept open for this provider's client.
+
+        Optional: open sessions are also closed at interpreter exit. A later
+        call on the provider opens a new session.
+        """
+        if _loop is not None and self._client in _open_clients:
+            _open_clients.remove(self._client)
+            _loop.run_until_complete(self._client.__aexit__(None, None, None))
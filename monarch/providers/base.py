@@ -41,6 +41,23 @@ class TransactionsProvider(Protocol):
         """Update a transaction. Only provided fields are updated."""
         ...
 
+    def update_transactions(
+        self,
+        transaction_ids: list[str],
+        category_id: Optional[str] = None,
+        merchant_name: Optional[str] = None,
+        notes: Optional[str] = None,
+        amount: Optional[float] = None,
+        date: Optional[str] = None,
+        hide_from_reports: Optional[bool] = None,
+        needs_review: Optional[bool] = None,
+    ) -> list[dict]:
+        """Apply the same update to several transactions, returning each one.
+
+        Raises if any update fails, naming the failed and the updated IDs.
+        """
+        ...
+
     def bulk_update_transactions(
         self,
         transaction_ids: list[str],
@@ -93,4 +110,10 @@ class RecurringProvider(Protocol):
 @runtime_checkable
 class Provider(TransactionsProvider, AccountsProvider, CategoriesProvider, RecurringProvider, Protocol):
     """Combined provider interface for all operations."""
-    pass
+
+    def get_accounts_and_categories(self) -> tuple[list[dict], list[dict]]:
+        """Get all accounts and categories in one call.
+
+        Providers backed by a remote API may fetch both concurrently.
+        """
+        ...
@@ -1,9 +1,18 @@
 """Local provider implementation using TinyDB."""
 
+import bisect
+import itertools
 from pathlib import Path
 from typing import Optional
 
-from tinydb import TinyDB, Query
+from tinydb import TinyDB
+
+from .storage import FastJSONStorage
+
+
+def _txn_date(txn: dict) -> str:
+    """Sort key ordering transactions by ISO date."""
+    return txn.get("date", "")
 
 
 class LocalProvider:
@@ -12,11 +21,27 @@ class LocalProvider:
     def __init__(self, db_path: Optional[Path] = None):
         if db_path is None:
             db_path = Path(__file__).parent / "test_data.json"
-        self._db = TinyDB(db_path)
+        self._db = TinyDB(db_path, storage=FastJSONStorage)
         self._transactions = self._db.table("transactions")
         self._accounts = self._db.table("accounts")
         self._categories = self._db.table("categories")
         self._recurring = self._db.table("recurring")
+        # Transactions table sorted newest first, with its dates in ascending
+        # order for bisecting date ranges; reused by reads until the next write
+        self._all_cache: Optional[list[dict]] = None
+        self._dates_asc: list[str] = []
+        # Account and category ID columns, in the cached (newest first) order
+        self._account_ids: list[Optional[str]] = []
+        self._category_ids: list[Optional[str]] = []
+        # Lowercased searchable text per cached transaction, in the same
+        # order; built on the first search after each refill
+        self._search_text: Optional[list[str]] = None
+        # Transaction ID -> TinyDB doc_id, so single-transaction reads and
+        # writes address the document directly instead of querying every row
+        self._doc_ids = {t.get("id"): t.doc_id for t in self._all_transactions()}
+        # Accounts and categories are never written here; index them by ID once
+        self._accounts_by_id = {a.get("id"): a for a in self._accounts.all()}
+        self._categories_by_id = {c.get("id"): c for c in self._categories.all()}
 
     def get_transactions(
         self,
@@ -29,41 +54,74 @@ class LocalProvider:
         search: Optional[str] = None,
     ) -> dict:
         """Get transactions with optional filters."""
-        all_txns = self._transactions.all()
+        all_txns = self._all_transactions()
 
-        # Apply filters
-        filtered = all_txns
+        # Narrow to the date range by binary search on the sorted table
+        newest, oldest = 0, len(all_txns)
+        if start_date or end_date:
+            if end_date:
+                newest = oldest - bisect.bisect_right(self._dates_asc, end_date)
+            if start_date:
+                oldest -= bisect.bisect_left(self._dates_asc, start_date)
+            all_txns = all_txns[newest:oldest]
 
-        if start_date:
-            filtered = [t for t in filtered if t.get("date", "") >= start_date]
-        if end_date:
-            filtered = [t for t in filtered if t.get("date", "") <= end_date]
+        # Filter column-wise: each filter maps its column slice to a boolean
+        # selector, and compress keeps the rows every selector accepts
+        selectors = []
+        if search:
+            texts = itertools.islice(self._searchable_text(), newest, oldest)
+            selectors.append(map(str.__contains__, texts, itertools.repeat(search.lower())))
         if account_ids:
-            filtered = [t for t in filtered if t.get("account", {}).get("id") in account_ids]
+            column = itertools.islice(self._account_ids, newest, oldest)
+            selectors.append(map(set(account_ids).__contains__, column))
         if category_ids:
-            filtered = [t for t in filtered if t.get("category", {}).get("id") in category_ids]
-        if search:
-            search_lower = search.lower()
-            filtered = [
-                t for t in filtered
-                if search_lower in (t.get("merchant", {}).get("name", "") or "").lower()
-                or search_lower in (t.get("notes", "") or "").lower()
-                or search_lower in (t.get("plaidName", "") or "").lower()
-            ]
+            column = itertools.islice(self._category_ids, newest, oldest)
+            selectors.append(map(set(category_ids).__contains__, column))
 
-        # Sort by date descending (newest first)
-        filtered.sort(key=lambda t: t.get("date", ""), reverse=True)
+        if len(selectors) == 1:
+            filtered = list(itertools.compress(all_txns, selectors[0]))
+        elif selectors:
+            filtered = list(itertools.compress(all_txns, map(all, zip(*selectors))))
+        else:
+            filtered = all_txns
 
+        # Already newest first, as filtering keeps the table's order. Rows are
+        # copied so callers reshaping results cannot alter the cached table
         total_count = len(filtered)
-        results = filtered[offset:offset + limit]
+        results = [dict(t) for t in filtered[offset:offset + limit]]
 
         return {"totalCount": total_count, "results": results}
 
+    def _all_transactions(self) -> list[dict]:
+        """Get every transaction newest first, reading the table only after a write."""
+        if self._all_cache is None:
+            self._all_cache = sorted(self._transactions.all(), key=_txn_date, reverse=True)
+            self._dates_asc = [_txn_date(t) for t in reversed(self._all_cache)]
+            self._account_ids = [(t.get("account") or {}).get("id") for t in self._all_cache]
+            self._category_ids = [(t.get("category") or {}).get("id") for t in self._all_cache]
+            self._search_text = None
+        return self._all_cache
+
+    def _searchable_text(self) -> list[str]:
+        """Get each cached transaction's merchant, notes and statement, lowercased.
+
+        Fields are joined with NUL so a search term cannot match across two.
+        """
+        if self._search_text is None:
+            self._search_text = [
+                "\0".join((
+                    (t.get("merchant") or {}).get("name") or "",
+                    t.get("notes") or "",
+                    t.get("plaidName") or "",
+                )).lower()
+                for t in self._all_transactions()
+            ]
+        return self._search_text
+
     def get_transaction(self, transaction_id: str) -> Optional[dict]:
         """Get a single transaction by ID."""
-        Txn = Query()
-        result = self._transactions.search(Txn.id == transaction_id)
-        return result[0] if result else None
+        doc_id = self._doc_ids.get(transaction_id)
+        return self._transactions.get(doc_id=doc_id) if doc_id is not None else None
 
     def update_transaction(
         self,
@@ -77,20 +135,17 @@ class LocalProvider:
         needs_review: Optional[bool] = None,
     ) -> dict:
         """Update a transaction. Only provided fields are updated."""
-        Txn = Query()
-        txn = self._transactions.search(Txn.id == transaction_id)
-        if not txn:
+        txn = self.get_transaction(transaction_id)
+        if txn is None:
             raise ValueError(f"Transaction not found: {transaction_id}")
 
-        txn = txn[0]
         updates = {}
 
         if category_id is not None:
             # Look up category
-            Cat = Query()
-            cat = self._categories.search(Cat.id == category_id)
+            cat = self._categories_by_id.get(category_id)
             if cat:
-                updates["category"] = {"id": category_id, "name": cat[0].get("name", "")}
+                updates["category"] = {"id": category_id, "name": cat.get("name", "")}
         if merchant_name is not None:
             updates["merchant"] = {
                 "id": txn.get("merchant", {}).get("id", ""),
@@ -108,10 +163,73 @@ class LocalProvider:
             updates["needsReview"] = needs_review
 
         if updates:
-            self._transactions.update(updates, Txn.id == transaction_id)
+            self._transactions.update(updates, doc_ids=[txn.doc_id])
+            self._all_cache = None
 
-        # Return updated transaction
-        return self._transactions.search(Txn.id == transaction_id)[0]
+        # Return updated transaction, patched like the stored copy rather than
+        # read back from the table
+        txn.update(updates)
+        return txn
+
+    def update_transactions(
+        self,
+        transaction_ids: list[str],
+        category_id: Optional[str] = None,
+        merchant_name: Optional[str] = None,
+        notes: Optional[str] = None,
+        amount: Optional[float] = None,
+        date: Optional[str] = None,
+        hide_from_reports: Optional[bool] = None,
+        needs_review: Optional[bool] = None,
+    ) -> list[dict]:
+        """Apply the same update to several transactions, returning each one.
+
+        Every transaction is attempted; if any fail, the ValueError raised
+        names the failures and the transactions that were updated.
+        """
+        updated, updated_ids, failures = [], [], []
+        for tid in transaction_ids:
+            try:
+                updated.append(self.update_transaction(
+                    tid, category_id, merchant_name, notes,
+                    amount, date, hide_from_reports, needs_review,
+                ))
+                updated_ids.append(tid)
+            except ValueError as e:
+                failures.append(str(e))
+
+        if failures:
+            raise ValueError(f"{'; '.join(failures)}. Updated: {', '.join(updated_ids) or 'none'}")
+        return updated
+
+    def bulk_update_transactions(
+        self,
+        transaction_ids: list[str],
+        needs_review: Optional[bool] = None,
+        category_id: Optional[str] = None,
+        hide_from_reports: Optional[bool] = None,
+    ) -> dict:
+        """Bulk update multiple transactions."""
+        updates = {}
+        if needs_review is not None:
+            updates["needsReview"] = needs_review
+        if category_id is not None:
+            cat = self._categories_by_id.get(category_id)
+            if cat:
+                updates["category"] = {"id": category_id, "name": cat.get("name", "")}
+        if hide_from_reports is not None:
+            updates["hideFromReports"] = hide_from_reports
+
+        doc_ids = {self._doc_ids[tid] for tid in transaction_ids if tid in self._doc_ids}
+        affected = self._transactions.update(updates, doc_ids=doc_ids) if updates else []
+        if affected:
+            self._all_cache = None
+        # Unknown IDs are skipped; report them so success means every ID was found
+        errors = [
+            {"message": f"Transaction not found: {tid}"}
+            for tid in dict.fromkeys(transaction_ids) if tid not in self._doc_ids
+        ]
+        return {"success": not errors, "affectedCount": len(affected), "errors": errors}
 
     def get_accounts(self) -> list[dict]:
         """Get all accounts."""
@@ -121,6 +239,10 @@ class LocalProvider:
         """Get all transaction categories."""
         return self._categories.all()
 
+    def get_accounts_and_categories(self) -> tuple[list[dict], list[dict]]:
+        """Get all accounts and categories."""
+        return self.get_accounts(), self.get_categories()
+
     def get_recurring_transaction_items(
         self,
         start_date: str,
@@ -163,18 +285,14 @@ class LocalProvider:
         import uuid
 
         # Look up account
-        Acct = Query()
-        acct = self._accounts.search(Acct.id == account_id)
-        if not acct:
+        acct = self._accounts_by_id.get(account_id)
+        if acct is None:
             raise ValueError(f"Account not found: {account_id}")
-        acct = acct[0]
 
         # Look up category
-        Cat = Query()
-        cat = self._categories.search(Cat.id == category_id)
-        if not cat:
+        cat = self._categories_by_id.get(category_id)
+        if cat is None:
             raise ValueError(f"Category not found: {category_id}")
-        cat = cat[0]
 
         # Generate a unique ID
         txn_id = str(uuid.uuid4().int)[:18]
@@ -208,7 +326,8 @@ class LocalProvider:
         }
 
         # Insert into database
-        self._transactions.insert(txn)
+        self._doc_ids[txn_id] = self._transactions.insert(txn)
+        self._all_cache = None
 
         return txn
 
@@ -0,0 +1,37 @@
+"""TinyDB storage that encodes through jsonutil."""
+
+import io
+import os
+
+from tinydb.storages import JSONStorage
+
+from ... import jsonutil
+
+
+class FastJSONStorage(JSONStorage):
+    """JSONStorage that parses and serializes with jsonutil (orjson when installed).
+
+    The file stays plain, compact JSON that the stock JSONStorage can read.
+    """
+
+    def __init__(self, path, create_dirs: bool = False, encoding: str = "utf-8", access_mode: str = "r+", **kwargs):
+        # jsonutil leaves non-ASCII characters unescaped, so pin the file encoding
+        super().__init__(path, create_dirs=create_dirs, encoding=encoding, access_mode=access_mode, **kwargs)
+
+    def read(self):
+        self._handle.seek(0, os.SEEK_END)
+        if not self._handle.tell():
+            # Empty file: let TinyDB initialize the database
+            return None
+        self._handle.seek(0)
+        return jsonutil.loads(self._handle.read())
+
+    def write(self, data) -> None:
+        self._handle.seek(0)
+        try:
+            self._handle.write(jsonutil.dumps(data, indent=False))
+        except io.UnsupportedOperation:
+            raise IOError(f'Cannot write to the database. Access mode is "{self._mode}"')
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.truncate()
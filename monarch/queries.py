@@ -86,9 +86,8 @@ query GetTransactionCategories {
 }
 """
 
-UPDATE_TRANSACTION_MUTATION = """
-mutation UpdateTransaction($input: UpdateTransactionMutationInput!) {
-  updateTransaction(input: $input) {
+# Result selection of updateTransaction, shared by the single and batched mutations
+UPDATE_TRANSACTION_PAYLOAD = """{
     transaction {
       id
       amount
@@ -126,8 +125,12 @@ mutation UpdateTransaction($input: UpdateTransactionMutationInput!) {
       message
       code
     }
-  }
-}
+  }"""
+
+UPDATE_TRANSACTION_MUTATION = f"""
+mutation UpdateTransaction($input: UpdateTransactionMutationInput!) {{
+  updateTransaction(input: $input) {UPDATE_TRANSACTION_PAYLOAD}
+}}
 """
 
 GET_TRANSACTION_QUERY = """
@@ -1,6 +1,6 @@
 """Transaction utilities."""
 
-from .list import format_csv, format_text
+from .list import format_csv, format_text, write_csv
 from .get import format_text as format_single_text
 
-__all__ = ["format_csv", "format_text", "format_single_text"]
+__all__ = ["format_csv", "format_text", "format_single_text", "write_csv"]
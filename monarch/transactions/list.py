@@ -2,7 +2,7 @@
 
 import csv
 import io
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
 
 from ..queries import TRANSACTIONS_QUERY
 
@@ -40,28 +40,36 @@ async def get_transactions(
     return data.get("allTransactions", {"totalCount": 0, "results": []})
 
 
+CSV_FIELDS = ("date", "account", "merchant", "category", "amount", "notes", "original_statement")
+
+
 def format_csv(transactions: list[dict]) -> str:
     """Format transactions as CSV."""
-    if not transactions:
-        return ""
-
     output = io.StringIO()
-    fieldnames = ["date", "account", "merchant", "category", "amount", "notes", "original_statement"]
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
+    write_csv(transactions, output)
+    return output.getvalue()
 
-    for t in transactions:
-        writer.writerow({
-            "date": t.get("date", ""),
-            "account": t.get("account", {}).get("displayName", ""),
-            "merchant": t.get("merchant", {}).get("name", ""),
-            "category": t.get("category", {}).get("name", ""),
-            "amount": t.get("amount", 0),
-            "notes": t.get("notes", ""),
-            "original_statement": t.get("plaidName", ""),
-        })
 
-    return output.getvalue()
+def write_csv(transactions: list[dict], out: TextIO) -> None:
+    """Write transactions as CSV to a text stream (nothing if there are none)."""
+    if not transactions:
+        return
+
+    writer = csv.writer(out)
+    writer.writerow(CSV_FIELDS)
+    # Tuples in CSV_FIELDS order, skipping DictWriter's per-row dict
+    writer.writerows(
+        (
+            t.get("date", ""),
+            (t.get("account") or {}).get("displayName", ""),
+            (t.get("merchant") or {}).get("name", ""),
+            (t.get("category") or {}).get("name", ""),
+            t.get("amount", 0),
+            t.get("notes", ""),
+            t.get("plaidName", ""),
+        )
+        for t in transactions
+    )
 
 
 def format_text(transactions: list[dict]) -> str:
@@ -82,36 +90,28 @@ def format_text(transactions: list[dict]) -> str:
     col_widths = [10, 24, 20, 12]
     alignments = ["l", "l", "l", "r"]
 
-    def make_table(rows: list[tuple]) -> list[str]:
-        result = []
-        separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
-        result.append(separator)
-        for i, row in enumerate(rows):
-            cells = []
-            for val, width, align in zip(row, col_widths, alignments):
-                text = str(val)[:width]
-                if align == "r":
-                    cells.append(f" {text:>{width}} ")
-                else:
-                    cells.append(f" {text:<{width}} ")
-            result.append("|" + "|".join(cells) + "|")
-            if i == 0:
-                result.append(separator)
-        result.append(separator)
-        return result
-
-    rows = [("Date", "Merchant", "Category", "Amount")]
+    # Row template built once; each %.Ns cell both pads and truncates, so a
+    # row is a single % operation formatted straight into lines
+    row_fmt = "|" + "|".join(
+        f" %{w}.{w}s " if align == "r" else f" %-{w}.{w}s "
+        for w, align in zip(col_widths, alignments)
+    ) + "|"
+    separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
+
+    lines.append(separator)
+    lines.append(row_fmt % ("Date", "Merchant", "Category", "Amount"))
+    lines.append(separator)
 
+    total = 0
     for t in transactions:
-        date = t.get("date", "")
-        merchant = (t.get("merchant") or {}).get("name", "") or t.get("plaidName", "")[:24]
+        merchant = (t.get("merchant") or {}).get("name", "") or t.get("plaidName") or ""
         category = (t.get("category") or {}).get("name", "")
         amount = t.get("amount", 0) or 0
-        rows.append((date, merchant[:24], category[:20], fmt_money(amount)))
+        total += amount
+        lines.append(row_fmt % (t.get("date", ""), merchant, category, fmt_money(amount)))
 
-    lines.extend(make_table(rows))
+    lines.append(separator)
 
-    total = sum(t.get("amount", 0) or 0 for t in transactions)
     lines.append("")
     lines.append(f"Total: {fmt_money(total)}")
 
@@ -2,12 +2,11 @@
 
 from typing import Any, Optional
 
-from ..queries import UPDATE_TRANSACTION_MUTATION
+from ..queries import UPDATE_TRANSACTION_MUTATION, UPDATE_TRANSACTION_PAYLOAD
 from ..client import APIError
 
 
-async def update_transaction(
-    client,
+def _update_input(
     transaction_id: str,
     category_id: Optional[str] = None,
     merchant_name: Optional[str] = None,
@@ -16,36 +15,107 @@ async def update_transaction(
     date: Optional[str] = None,
     hide_from_reports: Optional[bool] = None,
     needs_review: Optional[bool] = None,
-) -> dict:
-    """Update a transaction. Only provided fields are updated."""
-    variables: dict[str, Any] = {
-        "input": {
-            "id": transaction_id,
-        }
-    }
+) -> dict[str, Any]:
+    """Build the updateTransaction input, with only the provided fields."""
+    update: dict[str, Any] = {"id": transaction_id}
 
     # category and merchant can be empty string to clear, or None to skip
     if category_id is not None:
-        variables["input"]["category"] = category_id
+        update["category"] = category_id
     if merchant_name is not None:
-        variables["input"]["name"] = merchant_name
+        update["name"] = merchant_name
     if notes is not None:
-        variables["input"]["notes"] = notes
+        update["notes"] = notes
     if amount is not None:
-        variables["input"]["amount"] = amount
+        update["amount"] = amount
     if date is not None:
-        variables["input"]["date"] = date
+        update["date"] = date
     if hide_from_reports is not None:
-        variables["input"]["hideFromReports"] = hide_from_reports
+        update["hideFromReports"] = hide_from_reports
     if needs_review is not None:
-        variables["input"]["needsReview"] = needs_review
+        update["needsReview"] = needs_review
+
+    return update
 
-    data = await client._request(UPDATE_TRANSACTION_MUTATION, variables)
-    result = data.get("updateTransaction", {})
 
+def _transaction_or_raise(result: dict) -> dict:
+    """Return the updated transaction, or raise if the update reported errors."""
     if result.get("errors"):
         errors = result["errors"]
         msg = errors.get("message") or str(errors.get("fieldErrors", []))
         raise APIError(f"Update failed: {msg}")
 
     return result.get("transaction", {})
+
+
+async def update_transaction(
+    client,
+    transaction_id: str,
+    category_id: Optional[str] = None,
+    merchant_name: Optional[str] = None,
+    notes: Optional[str] = None,
+    amount: Optional[float] = None,
+    date: Optional[str] = None,
+    hide_from_reports: Optional[bool] = None,
+    needs_review: Optional[bool] = None,
+) -> dict:
+    """Update a transaction. Only provided fields are updated."""
+    variables = {
+        "input": _update_input(
+            transaction_id, category_id, merchant_name, notes,
+            amount, date, hide_from_reports, needs_review,
+        )
+    }
+
+    data = await client._request(UPDATE_TRANSACTION_MUTATION, variables)
+    return _transaction_or_raise(data.get("updateTransaction", {}))
+
+
+async def update_transactions(
+    client,
+    transaction_ids: list[str],
+    category_id: Optional[str] = None,
+    merchant_name: Optional[str] = None,
+    notes: Optional[str] = None,
+    amount: Optional[float] = None,
+    date: Optional[str] = None,
+    hide_from_reports: Optional[bool] = None,
+    needs_review: Optional[bool] = None,
+) -> list[dict]:
+    """Apply the same update to several transactions in one request.
+
+    Each transaction gets an aliased updateTransaction in a single mutation
+    document. The aliases run one after another and a failure does not undo
+    the others, so the APIError raised on failure names every transaction
+    that failed and every one that was updated.
+    """
+    if not transaction_ids:
+        return []
+
+    variables = {
+        f"u{i}": _update_input(
+            tid, category_id, merchant_name, notes,
+            amount, date, hide_from_reports, needs_review,
+        )
+        for i, tid in enumerate(transaction_ids)
+    }
+    params = ", ".join(f"${alias}: UpdateTransactionMutationInput!" for alias in variables)
+    fields = "\n".join(
+        f"  {alias}: updateTransaction(input: ${alias}) {UPDATE_TRANSACTION_PAYLOAD}"
+        for alias in variables
+    )
+    mutation = f"mutation UpdateTransactions({params}) {{\n{fields}\n}}\n"
+
+    data = await client._request(mutation, variables)
+
+    updated, updated_ids, failures = [], [], []
+    for alias, tid in zip(variables, transaction_ids):
+        try:
+            updated.append(_transaction_or_raise(data.get(alias, {})))
+            updated_ids.append(tid)
+        except APIError as e:
+            failures.append(f"{e} (transaction {tid})")
+
+    if failures:
+        raise APIError(f"{'; '.join(failures)}. Updated: {', '.join(updated_ids) or 'none'}")
+    return updated
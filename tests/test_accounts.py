@@ -40,3 +40,73 @@ class TestAccountsList:
             assert "institution" in account
             assert "id" in account["institution"]
             assert "name" in account["institution"]
+
+
+class TestAccountsAndCategories:
+    """Test the combined accounts + categories lookup."""
+
+    def test_get_accounts_and_categories_matches_individual_calls(self, local_provider):
+        """Test that the combined call returns the same data as the separate calls."""
+        accounts, categories = local_provider.get_accounts_and_categories()
+
+        assert accounts == local_provider.get_accounts()
+        assert categories == local_provider.get_categories()
+
+
+class TestAccountsFormatCsv:
+    """Test CSV formatting of accounts."""
+
+    def test_format_csv_quotes_special_fields(self):
+        """Test that commas, quotes and newlines are quoted and missing values left empty."""
+        from monarch.accounts import format_csv
+
+        accounts = [{
+            "id": "acc_quoted",
+            "displayName": 'Joint, "Household"',
+            "type": None,
+            "currentBalance": -12.5,
+            "institution": {"name": "Line\nBreak Bank"},
+            "mask": None,
+        }]
+
+        assert format_csv(accounts) == (
+            "id,name,type,balance,institution,mask\r\n"
+            'acc_quoted,"Joint, ""Household""",,-12.5,"Line\nBreak Bank",\r\n'
+        )
+
+
+class _BalanceClient:
+    """Client stand-in whose account balance moves with created transactions."""
+
+    def __init__(self, balance):
+        self.balance = balance
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def _request(self, query, variables=None):
+        if "createTransaction" in query:
+            self.balance += variables["input"]["amount"]
+            return {"createTransaction": {"transaction": {"id": "t1"}, "errors": None}}
+        return {"accounts": [{"id": "1", "currentBalance": self.balance}]}
+
+
+class TestAccountsFreshness:
+    """Test that account reads reflect writes made in the same process."""
+
+    def test_balance_after_create_transaction(self):
+        """Test that a read after a balance-updating write sees the new balance."""
+        from monarch.providers import APIProvider
+        provider = APIProvider(_BalanceClient(100.0))
+
+        assert provider.get_accounts()[0]["currentBalance"] == 100.0
+        provider.create_transaction(
+            date="2025-01-01", account_id="1", amount=-25.0,
+            merchant_name="Shop", category_id="c1", update_balance=True,
+        )
+
+        assert provider.get_accounts()[0]["currentBalance"] == 75.0
+        provider.close()
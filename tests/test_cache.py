@@ -0,0 +1,66 @@
+"""Tests for the on-disk lookup cache."""
+
+import os
+import time
+
+import pytest
+
+from monarch import cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("MONARCH_CACHE_DIR", str(path))
+    return path
+
+
+class TestCache:
+    """Test storing, loading, and clearing cache entries."""
+
+    def test_store_then_load(self):
+        """Test that a stored value loads back while fresh."""
+        cache.store("accounts", "scope", [{"id": "1"}])
+
+        assert cache.load("accounts", "scope", ttl=60) == [{"id": "1"}]
+
+    def test_missing_entry(self):
+        """Test that a missing entry loads as None."""
+        assert cache.load("accounts", "scope", ttl=60) is None
+
+    def test_stale_entry(self, cache_dir):
+        """Test that an entry older than ttl loads as None."""
+        cache.store("accounts", "scope", [{"id": "1"}])
+        old = time.time() - 120
+        os.utime(cache_dir / "accounts-scope.json", (old, old))
+
+        assert cache.load("accounts", "scope", ttl=60) is None
+
+    def test_scopes_are_separate(self):
+        """Test that entries for different scopes do not mix."""
+        cache.store("accounts", cache.scope_for_token("a"), [{"id": "1"}])
+
+        assert cache.load("accounts", cache.scope_for_token("b"), ttl=60) is None
+
+    def test_scope_does_not_contain_token(self):
+        """Test that the scope is derived without embedding the token."""
+        assert "secret-token" not in cache.scope_for_token("secret-token")
+
+    def test_clear(self):
+        """Test that clear removes all entries."""
+        cache.store("accounts", "scope", [])
+        cache.store("categories", "scope", [])
+
+        assert cache.clear() == 2
+        assert cache.load("accounts", "scope", ttl=60) is None
+
+    def test_clear_keeps_other_files(self, cache_dir):
+        """Test that clear leaves files it did not write in the cache directory."""
+        cache.store("accounts", "scope", [])
+        other = cache_dir / "other.json"
+        other.write_text("{}")
+
+        assert cache.clear() == 1
+        assert other.exists()
+
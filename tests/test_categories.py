@@ -51,3 +51,25 @@ class TestCategoriesList:
         assert "Restaurants" in names
         assert "Shopping" in names
         assert "Salary" in names
+
+
+class TestCategoriesFetch:
+    """Test the SDK category fetch."""
+
+    class _CountingClient:
+        def __init__(self):
+            self.calls = 0
+
+        async def _request(self, query, variables=None):
+            self.calls += 1
+            return {"categories": [{"id": "c1", "name": "Groceries"}]}
+
+    async def test_every_fetch_hits_the_api(self):
+        """Test that repeated fetches are not served from an in-process cache."""
+        from monarch.categories import get_categories
+        client = self._CountingClient()
+
+        await get_categories(client)
+        await get_categories(client)
+
+        assert client.calls == 2
@@ -0,0 +1,283 @@
+"""Tests for CLI commands."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from monarch import cache, cli
+
+
+class _StubProvider:
+    """Provider serving a fixed transaction list, paged like the API."""
+
+    def __init__(self, txns, total_count=None):
+        self.txns = txns
+        self.total_count = len(txns) if total_count is None else total_count
+        self.offsets = []
+
+    def get_transactions(self, limit=100, offset=0, **filters):
+        self.offsets.append(offset)
+        return {"totalCount": self.total_count, "results": self.txns[offset:offset + limit]}
+
+
+def _txn(i: int, merchant: str) -> dict:
+    return {"id": str(i), "date": "2025-01-01", "amount": -1.0, "merchant": {"name": merchant}}
+
+
+def _list(monkeypatch, provider, *args) -> dict:
+    monkeypatch.setattr(cli, "get_provider", lambda: provider)
+    result = CliRunner().invoke(cli.cli, ["transactions", "list", "--format", "json", *args])
+    assert result.exit_code == 0, result.output
+    return json.loads(result.output)
+
+
+class TestListTransactionsPaging:
+    """Test paging through client-side filtered transaction listings."""
+
+    @pytest.fixture(autouse=True)
+    def small_pages(self, monkeypatch):
+        """Scan in pages of 4 rows, at most 12 rows in all."""
+        monkeypatch.setattr(cli, "FILTER_PAGE_SIZE", 4)
+        monkeypatch.setattr(cli, "MAX_FILTER_SCAN", 12)
+
+    def test_fixed_page_size(self, monkeypatch):
+        """Test that pages are FILTER_PAGE_SIZE rows regardless of --limit."""
+        txns = [_txn(i, "Amazon") for i in range(10)]
+        provider = _StubProvider(txns)
+
+        result = _list(monkeypatch, provider, "--merchant", "amazon", "--limit", "6")
+
+        assert provider.offsets == [0, 4]
+        assert result["count"] == 6
+        assert result["scanned"] == 8
+
+    def test_matches_beyond_limit_are_truncated(self, monkeypatch):
+        """Test that matches dropped from the last page mark the result truncated."""
+        txns = [_txn(i, "Amazon" if i % 4 else "Target") for i in range(8)]
+        provider = _StubProvider(txns)
+
+        result = _list(monkeypatch, provider, "--merchant", "amazon", "--limit", "5")
+
+        assert result["count"] == 5
+        assert result["scanned"] == 8
+        assert result["truncated"] is True
+        assert result["message"].startswith("Showing 5 matching transactions (8 of 8 scanned)")
+
+    def test_scan_cap_stops_scanning(self, monkeypatch):
+        """Test that scanning stops after MAX_FILTER_SCAN rows with rows left unscanned."""
+        txns = [_txn(i, "Amazon" if i == 0 else "Target") for i in range(100)]
+        provider = _StubProvider(txns)
+
+        result = _list(monkeypatch, provider, "--merchant", "amazon", "--limit", "5")
+
+        assert provider.offsets == [0, 4, 8]
+        assert result["count"] == 1
+        assert result["truncated"] is True
+        assert result["message"].startswith("Showing 1 matching transactions (12 of 100 scanned)")
+
+    def test_no_more_pages(self, monkeypatch):
+        """Test that an empty page ends the scan without marking truncation."""
+        txns = [_txn(i, "Amazon" if i < 2 else "Target") for i in range(6)]
+        provider = _StubProvider(txns, total_count=50)
+
+        result = _list(monkeypatch, provider, "--merchant", "amazon", "--limit", "3")
+
+        assert provider.offsets == [0, 4, 6]
+        assert result["count"] == 2
+        assert "truncated" not in result
+
+    def test_all_candidates_scanned(self, monkeypatch):
+        """Test that a fully scanned listing under the limit is not truncated."""
+        txns = [_txn(i, "Amazon" if i % 2 else "Target") for i in range(10)]
+
+        result = _list(monkeypatch, _StubProvider(txns), "--merchant", "amazon", "--limit", "5")
+
+        assert result["count"] == 5
+        assert result["scanned"] == 10
+        assert "truncated" not in result
+
+    def test_unfiltered_listing_fetches_limit(self, monkeypatch):
+        """Test that a listing without client-side filters is one request of --limit rows."""
+        provider = _StubProvider([_txn(i, "Amazon") for i in range(10)])
+
+        result = _list(monkeypatch, provider, "--limit", "7")
+
+        assert provider.offsets == [0]
+        assert result["count"] == 7
+        assert "scanned" not in result
+        assert result["message"].startswith("Showing 7 of 10 transactions")
+
+
+class TestMarkReviewed:
+    """Test the mark-reviewed command against the local provider."""
+
+    def test_unknown_id_is_reported(self, local_provider, monkeypatch):
+        """Test that an unknown ID is reported as failed, not as marked."""
+        txn_id = local_provider.get_transactions(limit=1)["results"][0]["id"]
+        monkeypatch.setattr(cli, "get_provider", lambda: local_provider)
+
+        result = CliRunner().invoke(
+            cli.cli, ["transactions", "mark-reviewed", f"{txn_id},bogus1", "--format", "json"]
+        )
+
+        assert result.exit_code == 0, result.output
+        output = json.loads(result.output)
+        assert output["success_count"] == 1
+        assert output["results"][0] == {"id": txn_id, "success": True}
+        assert output["results"][1]["success"] is False
+        assert "bogus1" in output["results"][1]["error"]
+
+    def test_all_known_ids(self, local_provider, monkeypatch):
+        """Test that a batch of known IDs is marked in one bulk update."""
+        ids = [t["id"] for t in local_provider.get_transactions(limit=3)["results"]]
+        monkeypatch.setattr(cli, "get_provider", lambda: local_provider)
+
+        result = CliRunner().invoke(cli.cli, ["transactions", "mark-reviewed", ",".join(ids)])
+
+        assert result.output.strip() == "Marked 3/3 transactions as reviewed"
+
+    def test_bulk_success_is_trusted(self, monkeypatch):
+        """Test that a successful batch is not redone per ID when fewer rows changed."""
+        class Provider:
+            def __init__(self):
+                self.bulk_ids = None
+                self.single_updates = 0
+
+            def bulk_update_transactions(self, ids, needs_review=None):
+                self.bulk_ids = ids
+                # Already-reviewed rows are not counted as affected
+                return {"success": True, "affectedCount": 1, "errors": []}
+
+            def update_transaction(self, **kwargs):
+                self.single_updates += 1
+
+        provider = Provider()
+        monkeypatch.setattr(cli, "get_provider", lambda: provider)
+
+        result = CliRunner().invoke(cli.cli, ["transactions", "mark-reviewed", "1,2,1,3"])
+
+        assert provider.bulk_ids == ["1", "2", "3"]
+        assert provider.single_updates == 0
+        assert result.output.strip() == "Marked 3/3 transactions as reviewed"
+
+
+class _LookupProvider(_StubProvider):
+    """Stub provider with a cache scope and a mutable category list."""
+
+    cache_scope = "scope"
+
+    def __init__(self, categories):
+        super().__init__([])
+        self.categories = categories
+        self.category_fetches = 0
+
+    def get_categories(self):
+        self.category_fetches += 1
+        return self.categories
+
+
+class TestNameLookupCache:
+    """Test resolving names against the on-disk lookup cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Point the cache at a temporary directory."""
+        monkeypatch.setenv("MONARCH_CACHE_DIR", str(tmp_path / "cache"))
+
+    def test_cached_lists_hold_only_ids_and_names(self, monkeypatch):
+        """Test that cached categories keep just the ID and name."""
+        provider = _LookupProvider([{"id": "c1", "name": "Groceries", "group": {"id": "g1"}}])
+
+        _list(monkeypatch, provider, "--category", "Groceries")
+
+        assert cache.load("categories", "scope", ttl=60) == [{"id": "c1", "name": "Groceries"}]
+
+    def test_unknown_name_refetches_once(self, monkeypatch):
+        """Test that a name missing from the cached list is looked up in a fresh one."""
+        provider = _LookupProvider([{"id": "c1", "name": "Groceries"}])
+        _list(monkeypatch, provider, "--category", "Groceries")
+        provider.categories = provider.categories + [{"id": "c2", "name": "New Category"}]
+
+        _list(monkeypatch, provider, "--category", "New Category")
+
+        assert provider.category_fetches == 2
+        assert {"id": "c2", "name": "New Category"} in cache.load("categories", "scope", ttl=60)
+
+    def test_cached_name_skips_fetch(self, monkeypatch):
+        """Test that a name found in the cached list needs no fetch."""
+        provider = _LookupProvider([{"id": "c1", "name": "Groceries"}])
+        _list(monkeypatch, provider, "--category", "Groceries")
+
+        _list(monkeypatch, provider, "--category", "Groceries")
+
+        assert provider.category_fetches == 1
+
+    def test_no_cache(self, monkeypatch):
+        """Test that --no-cache neither reads nor writes the cache."""
+        provider = _LookupProvider([{"id": "c1", "name": "Groceries"}])
+        monkeypatch.setattr(cli, "get_provider", lambda: provider)
+
+        result = CliRunner().invoke(cli.cli, ["--no-cache", "transactions", "list", "--category", "Groceries"])
+
+        assert result.exit_code == 0, result.output
+        assert cache.load("categories", "scope", ttl=60) is None
+
+
+class TestListSearchHint:
+    """Test the server-side search term sent with text filters."""
+
+    def test_statement_filter_sends_no_search(self, monkeypatch):
+        """Test that --original-statement does not narrow the server search."""
+        calls = []
+
+        class Provider(_StubProvider):
+            def get_transactions(self, limit=100, offset=0, **filters):
+                calls.append(filters.get("search"))
+                return super().get_transactions(limit, offset)
+
+        _list(monkeypatch, Provider([]), "--original-statement", "*AMAZON MKTPLACE*")
+
+        assert calls == [None]
+
+
+class TestUpdateTransactions:
+    """Test the update command with several IDs."""
+
+    def test_partial_failure_names_updated_ids(self, local_provider, monkeypatch):
+        """Test that a failed batch reports which transactions were updated."""
+        txn_id = local_provider.get_transactions(limit=1)["results"][0]["id"]
+        monkeypatch.setattr(cli, "get_provider", lambda: local_provider)
+
+        result = CliRunner().invoke(
+            cli.cli, ["transactions", "update", f"{txn_id},bogus1", "--notes", "x"]
+        )
+
+        assert result.exit_code == 1
+        assert "Transaction not found: bogus1" in result.output
+        assert f"Updated: {txn_id}" in result.output
+
+    def test_prefix_matching_server_keeps_matches(self, monkeypatch):
+        """Test that a server matching word prefixes does not drop wildcard matches."""
+        class Provider(_StubProvider):
+            def get_transactions(self, limit=100, offset=0, search=None, **filters):
+                txns = self.txns
+                if search:
+                    # Every search word must start some word of the merchant name
+                    needles = search.lower().split()
+                    txns = [t for t in txns if all(
+                        any(word.startswith(n) for word in t["merchant"]["name"].lower().split())
+                        for n in needles
+                    )]
+                return {"totalCount": len(txns), "results": txns[offset:offset + limit]}
+
+        txns = [_txn(0, "Amazon"), _txn(1, "Amazon Prime"), _txn(2, "Target")]
+
+        result = _list(monkeypatch, Provider(txns), "--merchant", "*mazon*")
+        assert result["count"] == 2
+
+        result = _list(monkeypatch, Provider(txns), "--merchant", "amazon p*")
+        assert [t["id"] for t in result["transactions"]] == ["1"]
+
+        result = _list(monkeypatch, Provider(txns), "--merchant", "Amazon Prime")
+        assert [t["id"] for t in result["transactions"]] == ["1"]
@@ -0,0 +1,107 @@
+"""Tests for CLI name and text filter helpers."""
+
+from monarch.cli import _find_id, _parse_multi_option, _resolve_ids, _search_hint
+
+
+ACCOUNTS = [
+    {"id": "1", "displayName": "Fairview Checking"},
+    {"id": "2", "displayName": "Fairview Savings"},
+    {"id": "3", "displayName": "Platinum Card"},
+    {"id": "4", "displayName": "Rewards Card"},
+]
+
+
+class TestResolveIds:
+    """Test resolving account/category names to IDs."""
+
+    def test_literal_names_are_case_insensitive(self):
+        """Test that literal names match regardless of case."""
+        ids = _resolve_ids(ACCOUNTS, "displayName", ["fairview checking", "PLATINUM CARD"])
+
+        assert ids == ["1", "3"]
+
+    def test_literal_name_requires_full_match(self):
+        """Test that a literal name does not match as a prefix."""
+        assert _resolve_ids(ACCOUNTS, "displayName", ["Fairview"]) == []
+
+    def test_wildcard_names(self):
+        """Test that wildcard names match via the union pattern."""
+        ids = _resolve_ids(ACCOUNTS, "displayName", ["fair*", "*CARD"])
+
+        assert ids == ["1", "2", "3", "4"]
+
+    def test_mixed_literal_and_wildcard(self):
+        """Test literal and wildcard names given together."""
+        ids = _resolve_ids(ACCOUNTS, "displayName", ["Rewards Card", "*savings"])
+
+        assert ids == ["2", "4"]
+
+    def test_no_matches(self):
+        """Test that unmatched names resolve to no IDs."""
+        assert _resolve_ids(ACCOUNTS, "displayName", ["nomatch", "zz*"]) == []
+
+
+class TestSearchHint:
+    """Test deriving a server-side search term from text filters."""
+
+    def test_first_word_of_leading_run(self):
+        """Test that a wildcard pattern contributes the first word before its wildcard."""
+        assert _search_hint("Whole F*", None) == "Whole"
+        assert _search_hint("Am*", "Giftcard [0-9]*") == "Giftcard"
+
+    def test_mid_pattern_fragment_is_not_used(self):
+        """Test that literal text after a leading wildcard is not sent."""
+        assert _search_hint("*mazon*", None) is None
+        assert _search_hint("?mazon", "*gift*") is None
+
+    def test_literal_pattern_is_used_whole(self):
+        """Test that a pattern without wildcards is sent as-is."""
+        assert _search_hint("Whole Foods", None) == "Whole Foods"
+
+    def test_no_literal_fragment(self):
+        """Test that pure wildcards or no filters give no search term."""
+        assert _search_hint("*", None) is None
+        assert _search_hint(None, None) is None
+
+
+CATEGORIES = [
+    {"id": "c1", "name": "Groceries"},
+    {"id": "c2", "name": "Restaurants"},
+    {"id": "c3", "name": "Fast Food"},
+    {"id": "c4", "name": "groceries"},
+]
+
+
+class TestFindId:
+    """Test resolving a single name through the lowercase index."""
+
+    def test_exact_match_is_case_insensitive(self):
+        """Test that an exact name matches regardless of case."""
+        assert _find_id(CATEGORIES, "name", "RESTAURANTS") == "c2"
+
+    def test_first_record_wins_on_duplicates(self):
+        """Test that the first of several same-named records is chosen."""
+        assert _find_id(CATEGORIES, "name", "groceries") == "c1"
+
+    def test_partial_match_fallback(self):
+        """Test that a substring match is used when no exact name exists."""
+        assert _find_id(CATEGORIES, "name", "food") == "c3"
+
+    def test_not_found(self):
+        """Test that an unknown name resolves to None."""
+        assert _find_id(CATEGORIES, "name", "travel") is None
+
+
+class TestParseMultiOption:
+    """Test splitting repeated, comma-separated option values."""
+
+    def test_commas_and_repeated_flags(self):
+        """Test that values from several flags are split and trimmed."""
+        values = ("Checking, Savings", " Card ")
+
+        assert _parse_multi_option(values) == ["Checking", "Savings", "Card"]
+
+    def test_empty_entries_are_dropped(self):
+        """Test that blank entries and stray commas are ignored."""
+        assert _parse_multi_option(("a,, ,b,", " ")) == ["a", "b"]
+        assert _parse_multi_option(()) == []
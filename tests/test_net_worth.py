@@ -0,0 +1,17 @@
+"""Tests for net worth formatting."""
+
+from monarch.net_worth import _fmt_money
+
+
+class TestFormatMoney:
+    """Test currency formatting in the net worth report."""
+
+    def test_zero_after_negative_zero(self):
+        """Test that 0.0 formats as $0.00 even right after -0.0 was formatted."""
+        _fmt_money(-0.0)
+
+        assert _fmt_money(0.0) == "$0.00"
+
+    def test_negative_amount(self):
+        """Test that negative amounts put the sign before the dollar sign."""
+        assert _fmt_money(-1234.5) == "-$1,234.50"
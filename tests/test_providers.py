@@ -0,0 +1,54 @@
+"""Tests for provider interfaces."""
+
+from monarch.client import MonarchClient
+from monarch.providers import APIProvider, Provider
+
+
+class TestProviderInterfaces:
+    """Test that providers implement the full provider interface."""
+
+    def test_api_provider(self):
+        """Test that APIProvider provides every Provider method."""
+        provider = APIProvider(MonarchClient(token="test-token"))
+
+        assert isinstance(provider, Provider)
+
+    def test_local_provider(self, local_provider):
+        """Test that LocalProvider provides every Provider method."""
+        assert isinstance(local_provider, Provider)
+
+
+class TestDefaultClient:
+    """Test the client shared by providers built without one."""
+
+    def test_shared_across_threads(self, monkeypatch):
+        """Test that a client created in another thread is reused by the caller."""
+        import threading
+        from monarch import client as client_module
+
+        monkeypatch.setenv("MONARCH_TOKEN", "test-token")
+        monkeypatch.setattr(client_module, "_default_client", None)
+        created = []
+        thread = threading.Thread(target=lambda: created.append(client_module.get_default_client()))
+        thread.start()
+        thread.join()
+
+        assert client_module.get_default_client() is created[0]
+
+
+class TestLocalStorage:
+    """Test the local provider's JSON storage."""
+
+    def test_writes_are_readable_by_stock_tinydb(self, local_provider, test_db_path):
+        """Test that an update round-trips through TinyDB's default storage."""
+        from tinydb import TinyDB
+
+        txn = local_provider.get_transactions(limit=1)["results"][0]
+        local_provider.update_transaction(txn["id"], merchant_name="Café Zoë", notes="naïve")
+        local_provider.close()
+
+        with TinyDB(test_db_path, encoding="utf-8") as db:
+            stored = next(t for t in db.table("transactions").all() if t["id"] == txn["id"])
+
+        assert stored["merchant"]["name"] == "Café Zoë"
+        assert stored["notes"] == "naïve"
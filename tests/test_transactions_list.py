@@ -63,3 +63,13 @@ class TestTransactionsListByDateRange:
 
         # totalCount should be the same regardless of limit
         assert result_small["totalCount"] == result_large["totalCount"]
+
+    def test_transactions_list_results_are_copies(self, local_provider):
+        """Test that changing a returned transaction does not alter later results."""
+        first = local_provider.get_transactions(limit=1)["results"][0]
+        first["notes"] = "changed by caller"
+
+        again = local_provider.get_transactions(limit=1)["results"][0]
+
+        assert again["id"] == first["id"]
+        assert again["notes"] != "changed by caller"
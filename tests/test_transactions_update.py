@@ -2,6 +2,9 @@
 
 import pytest
 
+from monarch.client import APIError
+from monarch.transactions.update import update_transactions
+
 
 class TestTransactionsUpdate:
     """Test updating transactions."""
@@ -67,3 +70,97 @@ class TestTransactionsUpdate:
         updated = local_provider.update_transaction(txn_id, notes="")
 
         assert updated["notes"] == ""
+
+
+class TestTransactionsBulkUpdate:
+    """Test bulk updating transactions."""
+
+    def test_bulk_update_needs_review(self, local_provider):
+        """Test marking several transactions reviewed in one call."""
+        result = local_provider.get_transactions(limit=3)
+        txn_ids = [t["id"] for t in result["results"]]
+
+        bulk = local_provider.bulk_update_transactions(txn_ids, needs_review=False)
+
+        assert bulk["success"] is True
+        assert bulk["affectedCount"] == len(txn_ids)
+        for txn_id in txn_ids:
+            assert local_provider.get_transaction(txn_id)["needsReview"] is False
+
+    def test_bulk_update_ignores_unknown_ids(self, local_provider):
+        """Test that unknown IDs are not counted as affected."""
+        result = local_provider.get_transactions(limit=1)
+        txn_id = result["results"][0]["id"]
+
+        bulk = local_provider.bulk_update_transactions([txn_id, "nonexistent_id"], needs_review=True)
+
+        assert bulk["affectedCount"] == 1
+        assert bulk["success"] is False
+        assert bulk["errors"] == [{"message": "Transaction not found: nonexistent_id"}]
+
+
+class TestTransactionsBatchUpdate:
+    """Test applying one update to several transactions."""
+
+    def test_update_transactions_local(self, local_provider):
+        """Test that every listed transaction gets the update."""
+        result = local_provider.get_transactions(limit=2)
+        txn_ids = [t["id"] for t in result["results"]]
+
+        updated = local_provider.update_transactions(txn_ids, notes="Batch note")
+
+        assert [t["id"] for t in updated] == txn_ids
+        for txn_id in txn_ids:
+            assert local_provider.get_transaction(txn_id)["notes"] == "Batch note"
+
+    async def test_update_transactions_single_request(self):
+        """Test that the API batch is sent as one aliased mutation."""
+        client = _RecordingClient()
+
+        updated = await update_transactions(client, ["1", "2"], notes="x")
+
+        assert len(client.requests) == 1
+        query, variables = client.requests[0]
+        assert "u0: updateTransaction(input: $u0)" in query
+        assert "u1: updateTransaction(input: $u1)" in query
+        assert variables == {"u0": {"id": "1", "notes": "x"}, "u1": {"id": "2", "notes": "x"}}
+        assert [t["id"] for t in updated] == ["1", "2"]
+
+    async def test_update_transactions_reports_failed_id(self):
+        """Test that an error names the transaction it belongs to."""
+        client = _RecordingClient(fail_alias="u1")
+
+        with pytest.raises(APIError, match="transaction 2"):
+            await update_transactions(client, ["1", "2"], notes="x")
+
+    async def test_update_transactions_names_updated_ids(self):
+        """Test that a partial failure names the transactions that were updated."""
+        client = _RecordingClient(fail_alias="u1")
+
+        with pytest.raises(APIError, match=r"\(transaction 2\)\. Updated: 1, 3$"):
+            await update_transactions(client, ["1", "2", "3"], notes="x")
+
+    def test_update_transactions_local_partial_failure(self, local_provider):
+        """Test that the local batch applies every valid update before raising."""
+        txn_id = local_provider.get_transactions(limit=1)["results"][0]["id"]
+
+        with pytest.raises(ValueError, match=f"nonexistent_id. Updated: {txn_id}$"):
+            local_provider.update_transactions(["nonexistent_id", txn_id], notes="Batch note")
+
+        assert local_provider.get_transaction(txn_id)["notes"] == "Batch note"
+
+
+class _RecordingClient:
+    """Client stand-in that records requests and echoes each update back."""
+
+    def __init__(self, fail_alias=None):
+        self.requests = []
+        self._fail_alias = fail_alias
+
+    async def _request(self, query, variables=None):
+        self.requests.append((query, variables))
+        return {
+            alias: {"errors": {"message": "bad"}} if alias == self._fail_alias
+            else {"transaction": {"id": update["id"]}, "errors": None}
+            for alias, update in variables.items()
+        }